@@ -2,11 +2,17 @@
 Domain Ownership Due Diligence Tool - FastAPI Backend
 Main Application Entry Point
 """
+import asyncio
+import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -14,13 +20,70 @@ sys.path.insert(0, str(Path(__file__).parent))
 from config.settings import settings
 from src.api.routes import health, domains, txt_verification
 from src.api.routes import pipeline
+from src.core.deepseek_client import get_deepseek_client
+from src.api.dependencies import get_rdap_client
+
+logger = logging.getLogger("app.startup")
+
+
+async def install_playwright_browsers():
+    """Install Playwright's Chromium once without blocking the event loop.
+    
+    A sentinel file in the data directory records a successful install so
+    later worker starts and reloads skip the installer entirely.
+    """
+    sentinel = Path(settings.data_dir) / ".playwright_installed"
+    if sentinel.exists():
+        return
+    
+    logger.info("🎭 Installing Playwright browsers...")
+    try:
+        process = await asyncio.create_subprocess_exec("playwright", "install", "chromium")
+        if await process.wait() == 0:
+            sentinel.touch()
+        else:
+            logger.warning(f"⚠️  Playwright install exited with code {process.returncode}")
+    except FileNotFoundError:
+        logger.warning("⚠️  Playwright CLI not found, skipping browser install")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown tasks."""
+    settings.ensure_directories()
+    
+    # Browsers are installed at build time (Dockerfile, Railway buildCommand);
+    # set INSTALL_PLAYWRIGHT=true to install them on first start instead
+    if os.environ.get("INSTALL_PLAYWRIGHT", "false").lower() == "true":
+        await install_playwright_browsers()
+    
+    # Shared HTTP client for outbound calls (external result delivery)
+    app.state.http = httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30)
+    )
+    
+    logger.info(
+        f"🚀 {settings.app_name} v{settings.app_version} ready (data: {settings.data_dir})",
+        extra={"app": settings.app_name, "version": settings.app_version, "data_dir": settings.data_dir}
+    )
+    
+    yield
+    
+    logger.info("🛑 Shutting down server", extra={"app": settings.app_name})
+    await app.state.http.aclose()
+    await get_deepseek_client().aclose()
+    await get_rdap_client().aclose()
+
 
 # Create FastAPI application
 app = FastAPI(
     title=settings.app_name,
     description="Automated domain verification with RDAP/WHOIS, Playwright scraping, and TXT verification",
     version=settings.app_version,
-    debug=settings.debug
+    debug=settings.debug,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for frontend integration
@@ -32,6 +95,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger payloads (result listings); level 1 keeps CPU cost low
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 # Include routers
 app.include_router(health.router)
 app.include_router(domains.router)
@@ -39,39 +105,30 @@ app.include_router(txt_verification.router)
 app.include_router(pipeline.router)
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Application startup tasks."""
-    print("=" * 80)
-    print(f"🚀 Starting {settings.app_name} v{settings.app_version}")
-    print("=" * 80)
-    print(f"📁 Data directory: {settings.data_dir}")
-    
-    # Create data directory if it doesn't exist
-    Path(settings.data_dir).mkdir(parents=True, exist_ok=True)
-    
-    # Install Playwright browsers on first run
-    if os.environ.get("INSTALL_PLAYWRIGHT", "true").lower() == "true":
-        print("🎭 Checking Playwright browsers...")
-        os.system("playwright install chromium")
-    
-    print("✅ Server ready!")
-    print("=" * 80)
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown tasks."""
-    print("\n🛑 Shutting down server...")
-
-
 if __name__ == "__main__":
+    # Development runner; production uses gunicorn with gunicorn.conf.py
     import uvicorn
     
+    # One handler on the root logger; uvicorn's own loggers propagate into it
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logging.getLogger().addHandler(handler)
+    logging.getLogger().setLevel(logging.INFO)
+    
+    # uvloop is not available on Windows; fall back to the stock asyncio loop
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    
     uvicorn.run(
         "app:app",
         host="0.0.0.0",
         port=settings.port if hasattr(settings, 'port') else 8000,
-        reload=True
+        reload=settings.uvicorn_reload,
+        workers=settings.uvicorn_workers,
+        loop=loop,
+        log_config=None
     )
 
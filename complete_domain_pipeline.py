@@ -9,110 +9,49 @@ Pipeline stages:
 
 All data organized by run_id in data/ folder
 """
+import argparse
 import asyncio
 import csv
-import json
+import io
 import os
-import shutil
-import subprocess
 import time
+from collections import Counter
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 import sys
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
+from urllib.parse import urlsplit
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from playwright.async_api import async_playwright
 import re
 import httpx
+import orjson
 
 from src.core.rdap_client import RDAPClient
+from src.core.rdap_cache import get_rdap_cache
+from src.core.deepseek_client import get_deepseek_client
 from src.core.txt_verification import TXTVerificationManager
+from src.core.txt_checker import TXTRecordChecker
 from src.models.domain import DomainResult
 from src.utils.csv_exporter import CSVExporter
 from config.settings import settings, DEEPSEEK_FALLBACK_KEY
 
 
-class CompleteDomainPipeline:
-    """Complete pipeline for domain verification."""
-    
-    def __init__(self, run_id: str):
-        """Initialize pipeline with run ID."""
-        self.run_id = run_id
-        self.run_dir = Path(f"data/run_{run_id}")
-        
-        # Create directory structure
-        self.screenshots_dir = self.run_dir / "screenshots"
-        self.intermediate_dir = self.run_dir / "intermediate"
-        self.results_dir = self.run_dir / "results"
-        
-        for dir_path in [self.screenshots_dir, self.intermediate_dir, self.results_dir]:
-            dir_path.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize clients
-        self.rdap_client = RDAPClient(api_ninjas_key=settings.api_ninjas_key)
-        self.txt_manager = TXTVerificationManager(
-            db_path=str(self.run_dir / "txt_verification.db")
-        )
-        
-        # Storage for results at each stage
-        self.stage1_results = []  # API results
-        self.stage2_results = []  # Playwright results
-        self.stage3_results = []  # TXT verification tasks
-        self.stage4_results = []  # TXT verification execution results
-        
-        self.domains = []
-    
-    def save_metadata(self, stage: str, data: dict):
-        """Save metadata for a stage."""
-        metadata_file = self.intermediate_dir / f"stage_{stage}_metadata.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, default=str)
-        print(f"   💾 Metadata saved: {metadata_file.name}")
-    
-    
-    async def parse_with_llm(self, page_text: str, domain: str, source_url: str) -> Dict:
-        """Parse WHOIS text scraped by Playwright using LLM
-        
-        Args:
-            page_text: Page text content
-            domain: Domain name
-            source_url: Data source URL
-            
-        Returns:
-            Parsed structured data
-        """
-        # Check if DeepSeek API key is configured (fallback to built-in key)
-        api_key = settings.deepseek_api_key or DEEPSEEK_FALLBACK_KEY
-        if not api_key:
-            # Show warning only once
-            if not hasattr(self, '_deepseek_warning_shown'):
-                print(f"\n      💡 DeepSeek API not configured, using regex parsing (current accuracy 70%)")
-                print(f"      💡 Enable AI parsing to improve to 75-80%, cost ~¥0.15/75 domains")
-                print(f"      💡 Set: export DEEPSEEK_API_KEY=sk-your-key")
-                print(f"      💡 Free key: https://platform.deepseek.com\n")
-                self._deepseek_warning_shown = True
-            return {}
-        
-        # Show which key is being used (obscured) and whether it came from fallback
-        key_source = "fallback" if api_key == DEEPSEEK_FALLBACK_KEY else "env"
-        print(f"      🤖 DeepSeek call ({key_source} key): {api_key[:10]}...{api_key[-4:]}")
-        
-        # Generate timestamp
-        timestamp = datetime.now(timezone.utc).isoformat()
-        
-        prompt = f"""You are a domain registration information extraction engine.
+# Instructions for parse_with_llm, sent as the system message on every call
+_LLM_SYSTEM_PROMPT = """You are a domain registration information extraction engine.
 
 Goal
 
-From the input below, extract domain registration facts into a STRICT JSON table.
+From the input in the user message, extract domain registration facts into a STRICT JSON table.
 
 You will receive:
 
 1. A small metadata header:
-   DATA_SOURCE: {source_url}
-   QUERY_TIMESTAMP: {timestamp}
+   DATA_SOURCE: <URL of the scraped page>
+   QUERY_TIMESTAMP: <ISO 8601 timestamp>
 
 2. Raw HTML or plain text of a WHOIS / RDAP / registrar web page, including any legal notices, rate-limit warnings, or other noise.
 
@@ -134,9 +73,9 @@ Your tasks:
 Output format (VERY IMPORTANT):
 - Return ONLY a single JSON object, with this exact top-level structure:
 
-{{
+{
   "domains": [
-    {{
+    {
       "domain": "example.com",
       "registrant_organization": null,
       "registrar": "Example Registrar Ltd.",
@@ -150,10 +89,10 @@ Output format (VERY IMPORTANT):
       "data_sources": [
         "https://www.example-registrar.com/whois/example.com"
       ],
-      "timestamp": "{timestamp}"
-    }}
+      "timestamp": "2025-01-01T00:00:00+00:00"
+    }
   ]
-}}
+}
 
 Extraction rules (CRITICAL):
 
@@ -218,142 +157,758 @@ Extraction rules (CRITICAL):
    - Do NOT place disclaimer text into any field.
 
 12. If the input contains zero recognizable domains:
-   - Return {{"domains": []}}
+   - Return {"domains": []}
 
 The raw input starts after the line:
 =====BEGIN INPUT=====
 and ends before the line:
 =====END INPUT=====
 
-Now read the input and return ONLY the JSON described above.
+Now read the input and return ONLY the JSON described above."""
+
+# Request options shared by every WHOIS parsing call. JSON mode guarantees a
+# parseable object; the per-domain schema is small.
+_LLM_OPTIONS = {
+    "response_format": {"type": "json_object"},
+    "temperature": 0.1,
+    "max_tokens": 800,
+}
+
+# Regex fallback patterns, compiled once at import. Each page is scanned in a
+# single pass; alternatives are split into named groups and ranked afterwards.
+# Every alternative is a lookahead, so a match consumes no text and a label
+# inside another field's value (e.g. "Registrar: Created 1/2/2003") is still
+# found, as it would be by a separate search per pattern.
+
+# who.is
+_WHOIS_COMBINED = re.compile(
+    r'(?=(?-i:Created)\s+(?P<created>\d{1,2}/\d{1,2}/\d{4}))'
+    r'|(?=Registrar:\s*(?P<registrar>.+))'
+    r'|(?=Registrant\s+Organization:\s*(?P<registrant_org>.+))'
+    r'|(?=Organization:\s*(?P<org>.+))',
+    re.IGNORECASE
+)
+_WHOIS_FIELDS = frozenset({'created', 'registrar', 'registrant_org', 'org'})
+
+# sidn.nl (may use Dutch labels)
+_SIDN_COMBINED = re.compile(
+    r'(?=Registrar:\s*(?P<registrar>.+))'
+    r'|(?=Beheerder:\s*(?P<beheerder>.+))'
+    r'|(?=Creation Date:\s*(?P<creation_date>\d{4}-\d{2}-\d{2}))'
+    r'|(?=Aangemaakt:\s*(?P<aangemaakt>\d{4}-\d{2}-\d{2}))'
+    r'|(?=Date registered:\s*(?P<date_registered>\d{4}-\d{2}-\d{2}))',
+    re.IGNORECASE
+)
+_SIDN_FIELDS = frozenset({'registrar', 'beheerder', 'creation_date', 'aangemaakt', 'date_registered'})
+
+# LLM input pre-cleaning: WHOIS result containers to prefer over the whole body,
+# and legal boilerplate paragraphs that carry no registration data
+_LLM_TEXT_SELECTORS = "main, .whois-results, #whois-data, .result-container"
+
+# Reads the results container's and the body's text in a single round trip
+_PAGE_TEXT_JS = """(selector) => {
+    const element = document.querySelector(selector);
+    return [element ? element.innerText : '', document.body ? document.body.innerText : ''];
+}"""
+# A legal notice paragraph: one that opens with the notice wording and text on
+# the same line, up to the next blank line. Inline mentions such as a
+# "Disclaimer" nav link are left alone. Applied after whitespace normalization,
+# so paragraphs are separated by exactly one blank line.
+_RE_BOILERPLATE = re.compile(r'(?i)(?:\A|(?<=\n\n))(?:terms of use|disclaimer|by querying)\b[^\S\n]*\S[^\n]*(?:\n[^\n]+)*\n*')
+_RE_BLANK_LINES = re.compile(r'\n\s*\n+')
+_RE_SPACES = re.compile(r'[ \t]+')
 
-=====BEGIN INPUT=====
-{page_text}
-=====END INPUT====="""
 
+def _clean_for_llm(text: str, max_chars: int) -> str:
+    """Strip boilerplate and redundant whitespace from page text, then cap its length.
+    
+    Args:
+        text: Raw page text
+        max_chars: Maximum number of characters to keep
+        
+    Returns:
+        Cleaned text for the LLM prompt
+    """
+    text = _RE_SPACES.sub(' ', text)
+    text = _RE_BLANK_LINES.sub('\n\n', text)
+    text = _RE_BOILERPLATE.sub('', text)
+    return text.strip()[:max_chars]
+
+
+# A normalized (lowercase ASCII) input cell that is a valid domain name: at
+# most 253 characters, LDH labels of 1-63 characters that do not start or end
+# with a hyphen, and an alphabetic or punycode TLD. Header cells, IPs and
+# malformed names fail, so Stage 1 never spends a lookup on them.
+_DOMAIN_RE = re.compile(
+    r'(?=.{1,253}$)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+(?:[a-z]{2,63}|xn--[a-z0-9-]{1,59})'
+)
+
+
+def _pct(part: int, whole: int) -> str:
+    """Format a ratio as a one-decimal percentage ("N/A" when whole is 0)."""
+    return f"{part / whole * 100:.1f}%" if whole else "N/A"
+
+
+def _normalize_domain(value: str) -> str:
+    """Reduce an input cell to a bare lowercase hostname.
+    
+    Internationalized names are converted to their ASCII (punycode) form,
+    which is what RDAP and DNS expect.
+    
+    Args:
+        value: Domain as entered, possibly with scheme, path or trailing dot
+        
+    Returns:
+        Normalized domain name
+    """
+    value = value.strip().lower().removeprefix('http://').removeprefix('https://')
+    value = value.split('/', 1)[0].rstrip('.')
+    if not value.isascii():
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(60.0)) as client:
-                response = await client.post(
-                    "https://api.deepseek.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "deepseek-chat",
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": prompt
-                            }
-                        ],
-                        "temperature": 0.1,
-                        "max_tokens": 1500
-                    }
-                )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    content = data.get('choices', [{}])[0].get('message', {}).get('content', '')
-                    usage = data.get('usage', {})
-                    
-                    # Clean possible markdown markers
-                    content = content.replace('```json', '').replace('```', '').strip()
-                    
-                    try:
-                        parsed = json.loads(content)
-                        
-                        # New prompt returns {"domains": [...]} structure
-                        # Extract first domain
-                        if 'domains' in parsed and len(parsed['domains']) > 0:
-                            domain_data = parsed['domains'][0]
-                            
-                            # Display token usage
-                            total_tokens = usage.get('total_tokens', 0)
-                            print(f"      🤖 LLM parsing successful | 📊 Tokens: {total_tokens}")
-                            
-                            return {
-                                'registrant_org': domain_data.get('registrant_organization'),
-                                'registrar': domain_data.get('registrar'),
-                                'creation_date': domain_data.get('creation_date'),
-                                'expiry_date': domain_data.get('expiry_date'),
-                                'nameservers': domain_data.get('nameservers', []),
-                                'registry': domain_data.get('registry'),
-                                'data_source': source_url,
-                                'timestamp': domain_data.get('timestamp'),
-                            }
-                        else:
-                            print(f"      ⚠️  LLM returned empty result, fallback to regex")
-                            return {}
-                    except Exception as e:
-                        print(f"      ⚠️  LLM parsing failed: {str(e)[:30]}, fallback to regex")
-                        return {}
-                else:
-                    print(f"      ⚠️  LLM API error: {response.status_code}, fallback to regex")
-                    return {}
+            value = value.encode('idna').decode('ascii')
+        except UnicodeError:
+            pass  # Left as is; the domain check rejects it
+    return value
+
+# Console and report separators, built once
+_RULE = "=" * 80
+_THIN_RULE = "-" * 80
+
+
+def _print_banner(title: str):
+    """Print a title framed by rules as one write."""
+    print(f"\n{_RULE}\n{title}\n{_RULE}")
+
+
+# One block per domain in TXT_VERIFICATION_INSTRUCTIONS.txt, filled from a Stage 3 task
+_TXT_INSTRUCTION_TEMPLATE = (
+    "Domain: {domain}\n"
+    "  Add DNS TXT record:\n"
+    "  Host/Name: {txt_name}\n"
+    "  Type: TXT\n"
+    "  Value: {token}\n"
+    "  Task ID: {task_id}\n"
+    "\n" + _THIN_RULE + "\n\n"
+)
+
+# One block per task in the Stage 4 console instructions
+_TXT_CONSOLE_TEMPLATE = (
+    "\n[{index}/{total}] {domain}\n"
+    "   Record Type: TXT\n"
+    "   Host/Name: @ (or leave blank for root domain)\n"
+    "   Value: {token}"
+)
+
+# Requests Stage 2 scrapers never need: only the DOM text is parsed
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+_BLOCKED_HOST_SUFFIXES = ('google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'hotjar.com')
+
+
+async def _block_heavy_resources(route):
+    """Playwright route handler that aborts assets and analytics beacons."""
+    request = route.request
+    host = urlsplit(request.url).hostname or ''
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or host.endswith(_BLOCKED_HOST_SUFFIXES):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class _PagePool:
+    """Reusable Stage 2 pages, each in its own isolated browser context.
+
+    Pages are created on demand and handed back after each domain, so a run
+    opens at most as many contexts as scrapes run concurrently instead of one
+    per domain. Cookies are cleared between domains; a page that was closed
+    or could not be reset is discarded and replaced on the next checkout.
+    """
+
+    def __init__(self, browser, block_resources: bool = True):
+        """Initialize the pool.
+
+        Args:
+            browser: Shared Playwright browser instance
+            block_resources: Install the heavy-resource route handler on new contexts
+        """
+        self.browser = browser
+        self.block_resources = block_resources
+        self._idle = []
+
+    async def _new_page(self):
+        """Open a page in a fresh context."""
+        context = await self.browser.new_context()
+        try:
+            if self.block_resources:
+                await context.route("**/*", _block_heavy_resources)
+            return await context.new_page()
+        except Exception:
+            await context.close()
+            raise
+
+    @asynccontextmanager
+    async def page(self):
+        """Check out an idle page (or open one) for the duration of the block."""
+        page = self._idle.pop() if self._idle else await self._new_page()
+        reusable = False
+        try:
+            yield page
+            reusable = not page.is_closed()
+        finally:
+            if reusable:
+                try:
+                    await page.context.clear_cookies()
+                    self._idle.append(page)
+                except Exception:
+                    reusable = False
+            if not reusable:
+                try:
+                    await page.context.close()
+                except Exception:
+                    pass
+
+    async def close(self):
+        """Close every idle page's context."""
+        idle, self._idle = self._idle, []
+        for page in idle:
+            try:
+                await page.context.close()
+            except Exception:
+                pass
+
+# Screenshots are diagnostic only (taken when a scrape finds no data, or for
+# every page when settings.debug is on): viewport-sized, compressed JPEG
+_SCREENSHOT_OPTIONS = {'type': 'jpeg', 'quality': 60, 'full_page': False}
+
+
+def _first_matches(pattern: re.Pattern, text: str, fields: frozenset) -> Dict[str, str]:
+    """Collect the first value of each named group in one pass over the text.
+    
+    Args:
+        pattern: Combined pattern with one named group per field
+        text: Text to scan
+        fields: Group names to collect; the scan stops once all are found
+        
+    Returns:
+        Mapping of group name to its first matched value
+    """
+    found = {}
+    for match in pattern.finditer(text):
+        for name, value in match.groupdict().items():
+            if value is not None and name not in found:
+                found[name] = value
+        if len(found) == len(fields):
+            break
+    return found
+
+
+class CompleteDomainPipeline:
+    """Complete pipeline for domain verification."""
+    
+    # Buffer size for stage output files
+    WRITE_BUFFER = 1 << 16
+    # Stage 4 prints a progress summary every this many domains when stdout is not a terminal
+    PROGRESS_EVERY = 100
+    
+    # Column order of the Stage 2 intermediate CSV
+    STAGE2_CSV_FIELDS = [
+        "domain",
+        "success",
+        "registrant_org",
+        "registrar",
+        "registry",
+        "creation_date",
+        "expiry_date",
+        "nameservers",
+        "data_source",
+        "parsing_method",
+        "error",
+    ]
+    
+    def __init__(self, run_id: str, pretty_json: bool = False):
+        """Initialize pipeline with run ID.
+        
+        Args:
+            run_id: Run identifier
+            pretty_json: Indent JSON outputs for debugging (larger, slower writes)
+        """
+        self.run_id = run_id
+        self.json_option = orjson.OPT_INDENT_2 if pretty_json else 0
+        self.run_dir = Path(f"data/run_{run_id}")
+        
+        # Create directory structure
+        self.screenshots_dir = self.run_dir / "screenshots"
+        self.intermediate_dir = self.run_dir / "intermediate"
+        self.results_dir = self.run_dir / "results"
+        
+        for dir_path in [self.screenshots_dir, self.intermediate_dir, self.results_dir]:
+            dir_path.mkdir(parents=True, exist_ok=True)
+        
+        # Stage 1 rows live only on disk
+        self.stage1_jsonl = self.intermediate_dir / "stage1_api_results.jsonl"
+        self.stage1_csv = self.intermediate_dir / "stage1_api_results.csv"
+        
+        # Final outputs
+        self.report_file = self.results_dir / "FINAL_REPORT.txt"
+        self.report_json = self.results_dir / "FINAL_REPORT.json"
+        self.results_csv = self.results_dir / f"all_results_{run_id}.csv"
+        self._results_csv = None  # csv.writer while Stages 1-2 fill results_csv
+        
+        # Screenshots saved by Stage 2, counted as they are taken
+        self.screenshot_count = 0
+        
+        # Initialize clients
+        self.rdap_client = RDAPClient(
+            api_ninjas_key=settings.api_ninjas_key,
+            host_interval=settings.rdap_host_interval,
+            host_concurrency=settings.rdap_host_concurrency,
+            cache=get_rdap_cache(),
+            timeout=settings.rdap_timeout
+        )
+        self.txt_manager = TXTVerificationManager(
+            db_path=str(self.run_dir / "txt_verification.db")
+        )
+        self.txt_checker = TXTRecordChecker(
+            nameservers=settings.txt_dns_nameservers,
+            lifetime=settings.txt_dns_lifetime,
+            max_cache_ttl=settings.txt_cache_max_ttl,
+            hedge=settings.txt_dns_hedge
+        )
+        # Pooled HTTP/2 DeepSeek client shared by every LLM call in this run
+        self.llm_client = get_deepseek_client()
+        # Settings fill in the fallback key, so a key is always available
+        self._deepseek_key = settings.deepseek_api_key or DEEPSEEK_FALLBACK_KEY
+        
+        # Pages waiting to be parsed in the next LLM micro-batch
+        self._llm_pending: List[Tuple] = []
+        self._llm_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._llm_batch_tasks = set()
+        
+        # Browser is launched on first use and kept for the pipeline's lifetime
+        self._playwright = None
+        self._browser = None
+        
+        # Per-site pacing for concurrent Playwright scrapes
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_last_request: Dict[str, float] = {}
+        
+        # Successful RDAP/WHOIS lookups by domain, so a name is fetched once per run
+        self._lookup_cache: Dict[str, Tuple[Dict, str]] = {}
+        
+        # Storage for results at each stage
+        self.stage1_count = 0  # API successes; rows are streamed to stage1_jsonl/stage1_csv
+        self.stage2_results = []  # Playwright results
+        # Rows actually written to the combined results CSV, per stage
+        self.csv_stage1_rows = 0
+        self.csv_stage2_rows = 0
+        self.stage3_results = []  # TXT verification tasks
+        self.stage4_status = Counter()  # TXT verification outcomes by status; rows go to JSONL
+        
+        self.domains = []
+    
+    async def _get_browser(self):
+        """Get the pipeline's Chromium instance, launching it on first use.
+        
+        Returns:
+            Shared Playwright browser
+        """
+        if self._browser is None:
+            self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(
+                headless=True,
+                args=['--disable-dev-shm-usage', '--no-sandbox', '--disable-gpu']
+            )
+        return self._browser
+    
+    async def close_browser(self):
+        """Close the browser and stop Playwright if they were started."""
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+    
+    async def aclose(self):
+        """Release browser, network and database resources held by the pipeline."""
+        await self.close_browser()
+        await self.llm_client.aclose()
+        await self.rdap_client.aclose()
+        self.txt_manager.db.close()
+    
+    def _write_json(self, path: Path, data):
+        """Write a JSON document in one call.
+        
+        Args:
+            path: Output file
+            data: JSON-serializable data
+        """
+        path.write_bytes(orjson.dumps(data, default=str, option=self.json_option))
+    
+    def _write_lines(self, path: Path, lines: List[str]):
+        """Write newline-separated text in one call.
+        
+        Args:
+            path: Output file
+            lines: Lines to write
+        """
+        path.write_text('\n'.join(lines), encoding='utf-8')
+    
+    def _append_jsonl(self, path: Path, records: List[Dict]):
+        """Append records to a JSON Lines file in one buffered write.
+        
+        Args:
+            path: Output file
+            records: JSON-serializable records
+        """
+        with open(path, 'ab', buffering=self.WRITE_BUFFER) as f:
+            f.write(b''.join(
+                orjson.dumps(record, default=str, option=orjson.OPT_APPEND_NEWLINE)
+                for record in records
+            ))
+    
+    def save_metadata(self, stage: str, data: dict):
+        """Save metadata for a stage."""
+        metadata_file = self.intermediate_dir / f"stage_{stage}_metadata.json"
+        self._write_json(metadata_file, data)
+        print(f"   💾 Metadata saved: {metadata_file.name}")
+    
+    
+    def _llm_key_label(self) -> str:
+        """Describe the DeepSeek key in use (obscured) and where it came from."""
+        api_key = self._deepseek_key
+        key_source = "fallback" if api_key == DEEPSEEK_FALLBACK_KEY else "env"
+        return f"{key_source} key: {api_key[:10]}...{api_key[-4:]}"
+    
+    @staticmethod
+    def _llm_cache_key(page_text: str, source_url: str) -> str:
+        """Cache identity of a single-page parse.
+        
+        The user message embeds a per-call timestamp, so the key is built from
+        the instructions and the page itself.
+        """
+        return f"{_LLM_SYSTEM_PROMPT}\n{source_url}\n{page_text}"
+    
+    @staticmethod
+    def _llm_result(domain_data: Dict, source_url: str, timestamp: str) -> Dict:
+        """Map one LLM domain record onto the pipeline's result fields."""
+        return {
+            'registrant_org': domain_data.get('registrant_organization'),
+            'registrar': domain_data.get('registrar'),
+            'creation_date': domain_data.get('creation_date'),
+            'expiry_date': domain_data.get('expiry_date'),
+            'nameservers': domain_data.get('nameservers', []),
+            'registry': domain_data.get('registry'),
+            'data_source': source_url,
+            'timestamp': timestamp,
+        }
+    
+    async def parse_with_llm(self, page_text: str, domain: str, source_url: str) -> Dict:
+        """Parse WHOIS text scraped by Playwright using LLM
+        
+        Pages arriving together from concurrent scrapes are grouped into
+        micro-batches (up to settings.llm_batch_size pages, waiting at most
+        settings.llm_batch_window seconds) and parsed with one request. A
+        batch never waits for more pages than Stage 2 has scrapers, so it is
+        sent as soon as every scraper is waiting on the LLM.
+        
+        Args:
+            page_text: Page text content
+            domain: Domain name
+            source_url: Data source URL
+            
+        Returns:
+            Parsed structured data
+        """
+        # Pages parsed before are served from the response cache without batching
+        cached = await self.llm_client.get_cached(self._llm_cache_key(page_text, source_url), **_LLM_OPTIONS)
+        batch_size = min(settings.llm_batch_size, settings.playwright_concurrency)
+        if batch_size <= 1 or cached is not None:
+            return await self._parse_single_with_llm(page_text, domain, source_url)
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._llm_pending.append((domain, source_url, page_text, future))
+        
+        if len(self._llm_pending) >= batch_size:
+            self._flush_llm_batch()
+        elif self._llm_flush_handle is None:
+            self._llm_flush_handle = loop.call_later(settings.llm_batch_window, self._flush_llm_batch)
+        
+        return await future
+    
+    def _flush_llm_batch(self):
+        """Send the pending pages as one batch."""
+        if self._llm_flush_handle is not None:
+            self._llm_flush_handle.cancel()
+            self._llm_flush_handle = None
+        
+        batch, self._llm_pending = self._llm_pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run_llm_batch(batch))
+            self._llm_batch_tasks.add(task)
+            task.add_done_callback(self._llm_batch_tasks.discard)
+    
+    async def _run_llm_batch(self, batch: List[Tuple]):
+        """Parse a batch and resolve each caller's future.
+        
+        Pages the batched response does not cover are retried one by one.
+        
+        Args:
+            batch: (domain, source_url, page_text, future) tuples
+        """
+        results = {}
+        try:
+            if len(batch) > 1:
+                results = await self._parse_batch_with_llm(batch)
+            
+            missing = [item for item in batch if item[0].lower() not in results]
+            singles = await asyncio.gather(*(
+                self._parse_single_with_llm(page_text, domain, source_url)
+                for domain, source_url, page_text, _ in missing
+            ))
+            for (domain, _, _, _), result in zip(missing, singles):
+                results[domain.lower()] = result
+        except Exception as e:
+            print(f"      ⚠️  LLM batch failed: {str(e)[:40]}, fallback to regex")
+        finally:
+            for domain, _, _, future in batch:
+                if not future.done():
+                    future.set_result(results.get(domain.lower(), {}))
+    
+    async def _parse_batch_with_llm(self, batch: List[Tuple]) -> Dict[str, Dict]:
+        """Parse several pages with one LLM request.
+        
+        Args:
+            batch: (domain, source_url, page_text, future) tuples
+            
+        Returns:
+            Parsed data keyed by lower-cased domain (may be incomplete)
+        """
+        print(f"      🤖 DeepSeek batch call ({len(batch)} pages, {self._llm_key_label()})")
+        
+        timestamp = datetime.now(timezone.utc).isoformat()
+        sections = "\n".join(
+            f"--- DOMAIN: {domain} | SOURCE: {source_url} ---\n{page_text}\n--- END ---"
+            for domain, source_url, page_text, _ in batch
+        )
+        user_message = (
+            f"DATA_SOURCE: given per section (use each section's SOURCE)\n"
+            f"QUERY_TIMESTAMP: {timestamp}\n\n"
+            f"The input contains {len(batch)} labeled sections, one per page. "
+            f"Return one object per section in \"domains\", with \"domain\" set to the section's DOMAIN.\n\n"
+            f"=====BEGIN INPUT=====\n{sections}\n=====END INPUT====="
+        )
+        
+        pages = {domain.lower(): (source_url, page_text) for domain, source_url, page_text, _ in batch}
+        results = {}
+        parsed = {}
+        try:
+            data = await self.llm_client.chat_completion(
+                messages=[
+                    {"role": "system", "content": _LLM_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_message}
+                ],
+                # Batch composition depends on scrape timing, so the response is
+                # cached per page below instead of under the batch
+                use_cache=False,
+                **{**_LLM_OPTIONS, "max_tokens": _LLM_OPTIONS["max_tokens"] * len(batch)}
+            )
+        except httpx.HTTPStatusError as e:
+            # Retrying page by page would hit the same API error
+            print(f"      ⚠️  LLM API error: {e.response.status_code}, fallback to regex")
+            return {name: {} for name in pages}
+        except Exception as e:
+            print(f"      ⚠️  LLM batch call failed: {str(e)[:40]}, retrying pages individually")
+            return {}
+        
+        try:
+            content = data.get('choices', [{}])[0].get('message', {}).get('content', '')
+            for domain_data in orjson.loads(content).get('domains', []):
+                name = str(domain_data.get('domain') or '').lower()
+                if name in pages and name not in results:
+                    results[name] = self._llm_result(domain_data, pages[name][0], timestamp)
+                    parsed[name] = domain_data
+        except Exception as e:
+            print(f"      ⚠️  LLM batch parsing failed: {str(e)[:30]}, retrying pages individually")
+        
+        # Store each page's record as a single-page response, so a later run
+        # finds it under the key parse_with_llm looks up
+        await asyncio.gather(*(
+            self.llm_client.store_cached(
+                self._llm_cache_key(pages[name][1], pages[name][0]),
+                {"choices": [{"message": {"content": orjson.dumps({"domains": [domain_data]}).decode()}}]},
+                **_LLM_OPTIONS
+            )
+            for name, domain_data in parsed.items()
+        ))
+        
+        total_tokens = data.get('usage', {}).get('total_tokens', 0)
+        print(f"      🤖 LLM batch parsed {len(results)}/{len(batch)} pages | 📊 Tokens: {total_tokens}")
+        return results
+    
+    async def _parse_single_with_llm(self, page_text: str, domain: str, source_url: str) -> Dict:
+        """Parse one page with its own LLM request.
+        
+        Args:
+            page_text: Page text content
+            domain: Domain name
+            source_url: Data source URL
+            
+        Returns:
+            Parsed structured data
+        """
+        print(f"      🤖 DeepSeek call ({self._llm_key_label()})")
+        
+        # Generate timestamp
+        timestamp = datetime.now(timezone.utc).isoformat()
+        
+        # Static instructions go in the system message (identical on every call, so
+        # the provider can reuse its prompt cache); only the page-specific tail varies
+        user_message = (
+            f"DATA_SOURCE: {source_url}\n"
+            f"QUERY_TIMESTAMP: {timestamp}\n\n"
+            f"=====BEGIN INPUT=====\n{page_text}\n=====END INPUT====="
+        )
         
+        try:
+            data = await self.llm_client.chat_completion(
+                messages=[
+                    {"role": "system", "content": _LLM_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_message}
+                ],
+                cache_key=self._llm_cache_key(page_text, source_url),
+                **_LLM_OPTIONS
+            )
+        except httpx.HTTPStatusError as e:
+            print(f"      ⚠️  LLM API error: {e.response.status_code}, fallback to regex")
+            return {}
         except Exception as e:
             print(f"      ⚠️  LLM call failed: {e}")
             return {}
+        
+        content = data.get('choices', [{}])[0].get('message', {}).get('content', '')
+        usage = data.get('usage', {})
+        
+        try:
+            parsed = orjson.loads(content)
+            
+            # New prompt returns {"domains": [...]} structure
+            # Extract first domain
+            if 'domains' in parsed and len(parsed['domains']) > 0:
+                domain_data = parsed['domains'][0]
+                
+                # Display token usage
+                total_tokens = usage.get('total_tokens', 0)
+                print(f"      🤖 LLM parsing successful | 📊 Tokens: {total_tokens}")
+                
+                return self._llm_result(domain_data, source_url, timestamp)
+            else:
+                print(f"      ⚠️  LLM returned empty result, fallback to regex")
+                return {}
+        except Exception as e:
+            print(f"      ⚠️  LLM parsing failed: {str(e)[:30]}, fallback to regex")
+            return {}
     
-    async def stage1_api_lookup(self, domains: List[str]):
-        """Stage 1: RDAP/WHOIS API lookup."""
+    async def stage1_api_lookup(self, domains: List[str], failed_queue: Optional[asyncio.Queue] = None):
+        """Stage 1: RDAP/WHOIS API lookup.
+        
+        Args:
+            domains: Domains to look up
+            failed_queue: Optional queue that receives each failed domain as soon
+                as its lookup fails, then None once the stage is done
+            
+        Returns:
+            Failed domains in input order
+        """
         
-        print("\n" + "=" * 80)
-        print("📡 STAGE 1: RDAP/WHOIS API Lookup")
-        print("=" * 80)
+        _print_banner("📡 STAGE 1: RDAP/WHOIS API Lookup")
         
         print(f"\n🔍 Processing {len(domains)} domains with API...")
         
         api_success = []
         api_failed = []
         
-        for i, domain in enumerate(domains, 1):
-            print(f"[{i}/{len(domains)}] {domain:30}", end=" ", flush=True)
-            
-            try:
-                lookup_data, source_url = await self.rdap_client.lookup_domain(domain)
-                
-                if lookup_data.get('data_source_type') == 'failed':
-                    print("❌ API failed")
-                    api_failed.append(domain)
-                else:
-                    print(f"✅ {lookup_data.get('data_source_type', 'unknown')}")
+        # Lookups run concurrently; RDAPClient paces requests per RDAP host
+        semaphore = asyncio.Semaphore(settings.rdap_concurrency)
+        total = len(domains)
+        
+        # Results are streamed to JSON Lines (full fidelity) and CSV (tabular)
+        # as each lookup completes
+        stage1_out = open(self.stage1_jsonl, 'wb', buffering=self.WRITE_BUFFER)
+        stage1_csv_out = open(self.stage1_csv, 'w',
+                              encoding='utf-8', newline='', buffering=self.WRITE_BUFFER)
+        stage1_csv = csv.writer(stage1_csv_out)
+        stage1_csv.writerow(CSVExporter.FIELD_ORDER)
+        
+        async def lookup(i: int, domain: str) -> bool:
+            async with semaphore:
+                try:
+                    cached = self._lookup_cache.get(domain)
+                    if cached is None:
+                        lookup_data, source_url = await self.rdap_client.lookup_domain(domain)
+                        if lookup_data.get('data_source_type') != 'failed':
+                            self._lookup_cache[domain] = (lookup_data, source_url)
+                    else:
+                        lookup_data, source_url = cached
                     
-                    # Create domain result
-                    domain_result = DomainResult(
-                        domain=domain,
-                        registrant_organization=lookup_data.get('registrant_org'),
-                        registrar=lookup_data.get('registrar'),
-                        registry=lookup_data.get('registry'),
-                        creation_date=lookup_data.get('creation_date'),
-                        expiry_date=lookup_data.get('expiry_date'),
-                        nameservers=lookup_data.get('nameservers', []),
-                        data_source=lookup_data.get('data_source'),
-                        timestamp=datetime.now(timezone.utc)
-                    )
+                    if lookup_data.get('data_source_type') == 'failed':
+                        print(f"[{i}/{total}] {domain:30} ❌ API failed")
+                        return False
                     
-                    self.stage1_results.append(domain_result)
-                    api_success.append(domain)
-                
-                await asyncio.sleep(2.0)
-                
-            except Exception as e:
-                print(f"❌ Error: {str(e)[:40]}")
-                api_failed.append(domain)
+                    # Plain row in DomainResult field order; no model is built
+                    row = {
+                        'domain': domain,
+                        'registrant_organization': lookup_data.get('registrant_org'),
+                        'registrar': lookup_data.get('registrar'),
+                        'registry': lookup_data.get('registry'),
+                        'creation_date': lookup_data.get('creation_date'),
+                        'expiry_date': lookup_data.get('expiry_date'),
+                        'nameservers': lookup_data.get('nameservers', []),
+                        'data_source': lookup_data.get('data_source'),
+                        'timestamp': datetime.now(timezone.utc)
+                    }
+                    stage1_out.write(orjson.dumps(row, default=str, option=orjson.OPT_APPEND_NEWLINE))
+                    cells = [CSVExporter.format_value(value) for value in row.values()]
+                    stage1_csv.writerow(cells)
+                    if self._results_csv is not None:
+                        self._results_csv.writerow(cells)
+                        self.csv_stage1_rows += 1
+                    print(f"[{i}/{total}] {domain:30} ✅ {lookup_data.get('data_source_type', 'unknown')}")
+                    return True
+                    
+                except Exception as e:
+                    print(f"[{i}/{total}] {domain:30} ❌ Error: {str(e)[:40]}")
+                    return False
+        
+        async def lookup_and_forward(i: int, domain: str) -> bool:
+            found = await lookup(i, domain)
+            if not found and failed_queue is not None:
+                failed_queue.put_nowait(domain)
+            return found
         
-        # Save Stage 1 results
-        stage1_file = self.intermediate_dir / "stage1_api_results.json"
-        with open(stage1_file, 'w', encoding='utf-8') as f:
-            json.dump(
-                [r.model_dump(mode='json') for r in self.stage1_results],
-                f, indent=2, default=str
+        try:
+            results = await asyncio.gather(
+                *(lookup_and_forward(i, domain) for i, domain in enumerate(domains, 1)),
+                return_exceptions=True
             )
+        finally:
+            stage1_out.close()
+            stage1_csv_out.close()
+            if failed_queue is not None:
+                failed_queue.put_nowait(None)
+        
+        # Collect in input order
+        for domain, result in zip(domains, results):
+            if result is True:
+                api_success.append(domain)
+            else:
+                api_failed.append(domain)
+        self.stage1_count = len(api_success)
         
-        # Save failed domains list for Stage 2
+        # Save failed domains list for Stage 2 off the event loop, which
+        # Stage 2 may be using concurrently
         failed_file = self.intermediate_dir / "stage1_failed_domains.txt"
-        with open(failed_file, 'w') as f:
-            f.write('\n'.join(api_failed))
+        await asyncio.to_thread(self._write_lines, failed_file, api_failed)
         
         # Save metadata
         self.save_metadata('1', {
@@ -361,7 +916,7 @@ Now read the input and return ONLY the JSON described above.
             'total_domains': len(domains),
             'successful': len(api_success),
             'failed': len(api_failed),
-            'success_rate': f"{len(api_success)/len(domains)*100:.1f}%",
+            'success_rate': _pct(len(api_success), len(domains)),
             'timestamp': datetime.now().isoformat()
         })
         
@@ -372,23 +927,38 @@ Now read the input and return ONLY the JSON described above.
         
         return api_failed
     
-    async def stage2_playwright_scraping(self, failed_domains: List[str]):
-        """Stage 2: Playwright scraping for API failures."""
+    async def stage2_playwright_scraping(self, failed_domains: Union[List[str], asyncio.Queue]):
+        """Stage 2: Playwright scraping for API failures.
         
-        stage2_file = self.intermediate_dir / "stage2_playwright_results.json"
+        Args:
+            failed_domains: Domains to scrape, or a queue fed by Stage 1 as
+                lookups fail (terminated by None) so both stages overlap
+            
+        Returns:
+            Domains that still have no data, in the order they were scraped
+        """
+        if isinstance(failed_domains, asyncio.Queue):
+            queue, total = failed_domains, None
+        else:
+            queue, total = asyncio.Queue(), len(failed_domains)
+            for domain in failed_domains:
+                queue.put_nowait(domain)
+            queue.put_nowait(None)
+        
+        stage2_file = self.intermediate_dir / "stage2_playwright_results.jsonl"
         txt_needed_file = self.intermediate_dir / "stage2_need_txt_verification.txt"
         
         # Ensure directories exist (defensive in case run folder was cleaned)
         self.intermediate_dir.mkdir(parents=True, exist_ok=True)
         self.results_dir.mkdir(parents=True, exist_ok=True)
         
-        if not failed_domains:
+        # The browser is only launched once there is something to scrape
+        first = await queue.get()
+        if first is None:
             print("\n✅ No domains need Playwright scraping (all succeeded in Stage 1)")
             # Persist empty artifacts so run folder always has Stage 2 outputs
-            with open(stage2_file, 'w', encoding='utf-8') as f:
-                json.dump([], f, indent=2)
-            with open(txt_needed_file, 'w') as f:
-                f.write('')
+            stage2_file.write_text('', encoding='utf-8')
+            txt_needed_file.write_text('', encoding='utf-8')
             self.save_metadata('2', {
                 'stage': 'Playwright Scraping',
                 'total_domains': 0,
@@ -399,11 +969,12 @@ Now read the input and return ONLY the JSON described above.
             })
             return []
         
-        print("\n" + "=" * 80)
-        print("🌐 STAGE 2: Playwright Scraping (who.is + sidn.nl for .nl domains)")
-        print("=" * 80)
+        _print_banner("🌐 STAGE 2: Playwright Scraping (who.is + sidn.nl for .nl domains)")
         
-        print(f"\n🔍 Processing {len(failed_domains)} failed domains with Playwright...")
+        if total is None:
+            print(f"\n🔍 Processing Stage 1 failures with Playwright as they arrive...")
+        else:
+            print(f"\n🔍 Processing {total} failed domains with Playwright...")
         print(f"   📍 Source 1: who.is (all domains)")
         print(f"   📍 Source 2: sidn.nl (fallback for .nl domains)")
         print()
@@ -411,67 +982,77 @@ Now read the input and return ONLY the JSON described above.
         playwright_success = []
         playwright_failed = []
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            
-            for i, domain in enumerate(failed_domains, 1):
-                print(f"[{i}/{len(failed_domains)}] {domain:30}", end=" ", flush=True)
-                
-                try:
-                    # First try who.is
-                    result = await self.scrape_with_playwright(browser, domain, i)
-                    
-                    # If who.is failed and domain is .nl, try sidn.nl
-                    if not result['success'] and domain.endswith('.nl'):
-                        print(f"⚠️  No data on who.is")
-                        print(f"      🔄 Trying sidn.nl...")
-                        
-                        await asyncio.sleep(2.0)
-                        result = await self.scrape_sidn_nl(browser, domain, i)
-                    
-                    if result['success']:
-                        print(f"✅ Data found ({result.get('data_source', 'unknown')})")
-                        if result.get('creation_date'):
-                            print(f"      Created: {result['creation_date']}")
-                        if result.get('registrar'):
-                            print(f"      Registrar: {result['registrar'][:40]}")
-                        playwright_success.append(domain)
-                    else:
-                        print(f"⚠️  No data")
-                        playwright_failed.append(domain)
-                    
-                    self.stage2_results.append(result)
-                    
-                    await asyncio.sleep(3.0)
-                    
-                except Exception as e:
-                    print(f"❌ Error: {str(e)[:40]}")
-                    playwright_failed.append(domain)
-                    self.stage2_results.append({
-                        'domain': domain,
-                        'success': False,
-                        'error': str(e)
-                    })
-            
-            await browser.close()
+        # Results are streamed to JSON Lines (full fidelity) and CSV (tabular)
+        # as each scrape completes
+        stage2_out = open(stage2_file, 'wb', buffering=self.WRITE_BUFFER)
+        stage2_csv_out = open(self.intermediate_dir / "stage2_playwright_results.csv", 'w',
+                              encoding='utf-8', newline='', buffering=self.WRITE_BUFFER)
+        stage2_csv = csv.writer(stage2_csv_out)
+        stage2_csv.writerow(self.STAGE2_CSV_FIELDS)
+        
+        # Connect to DeepSeek while the browser starts, so the first LLM
+        # extraction does not pay for DNS and the TLS handshake
+        llm_warmup = asyncio.create_task(self.llm_client.warmup())
+        
+        # One page per consumer, so the pool never holds more than
+        # playwright_concurrency pages
+        pages = _PagePool(await self._get_browser(), settings.playwright_block_resources)
+        scraped = []  # Domains in the order their scrapes started
+        results = {}
+        pending = [first]
+        
+        async def next_domain() -> Optional[str]:
+            if pending:
+                return pending.pop()
+            domain = await queue.get()
+            if domain is None:
+                queue.put_nowait(None)  # Let the other consumers see the end too
+            return domain
+        
+        async def consumer():
+            while (domain := await next_domain()) is not None:
+                scraped.append(domain)
+                results[domain] = await scrape(len(scraped), domain)
+        
+        async def scrape(i: int, domain: str) -> Dict:
+            result = await self._scrape_one(pages, domain, i, total)
+            stage2_out.write(orjson.dumps(result, default=str, option=orjson.OPT_APPEND_NEWLINE))
+            stage2_csv.writerow([
+                CSVExporter.format_value(result.get(field))
+                for field in self.STAGE2_CSV_FIELDS
+            ])
+            if result.get('success') and self._results_csv is not None:
+                self._write_stage2_result_row(result)
+            return result
         
-        # Save Stage 2 results
-        stage2_file = self.intermediate_dir / "stage2_playwright_results.json"
-        with open(stage2_file, 'w', encoding='utf-8') as f:
-            json.dump(self.stage2_results, f, indent=2)
+        try:
+            await asyncio.gather(*(consumer() for _ in range(settings.playwright_concurrency)))
+        finally:
+            llm_warmup.cancel()
+            await pages.close()
+            stage2_out.close()
+            stage2_csv_out.close()
+        
+        # Collect in the order the scrapes started
+        for domain in scraped:
+            result = results[domain]
+            self.stage2_results.append(result)
+            if result.get('success'):
+                playwright_success.append(domain)
+            else:
+                playwright_failed.append(domain)
         
         # Save domains that still need TXT verification
         txt_needed_file = self.intermediate_dir / "stage2_need_txt_verification.txt"
-        with open(txt_needed_file, 'w') as f:
-            f.write('\n'.join(playwright_failed))
+        self._write_lines(txt_needed_file, playwright_failed)
         
         # Save metadata
         self.save_metadata('2', {
             'stage': 'Playwright Scraping',
-            'total_domains': len(failed_domains),
+            'total_domains': len(scraped),
             'successful': len(playwright_success),
             'failed': len(playwright_failed),
-            'success_rate': f"{len(playwright_success)/len(failed_domains)*100:.1f}%" if failed_domains else "N/A",
+            'success_rate': _pct(len(playwright_success), len(scraped)),
             'timestamp': datetime.now().isoformat()
         })
         
@@ -482,11 +1063,115 @@ Now read the input and return ONLY the JSON described above.
         
         return playwright_failed
     
-    async def scrape_sidn_nl(self, browser, domain: str, index: int):
+    def _write_stage2_result_row(self, result: Dict):
+        """Append a successful Stage 2 scrape to the combined results CSV.
+        
+        Args:
+            result: Scrape result dictionary
+        """
+        try:
+            domain_result = DomainResult(
+                domain=result['domain'],
+                registrant_organization=result.get('registrant_org'),
+                registrar=result.get('registrar'),
+                registry=result.get('registry'),
+                creation_date=result.get('creation_date'),
+                expiry_date=result.get('expiry_date'),
+                nameservers=result.get('nameservers', []),
+                data_source=result.get('data_source', 'Playwright'),
+                timestamp=datetime.now(timezone.utc)
+            )
+        except ValueError as e:
+            print(f"      ⚠️  {result['domain']}: not added to results CSV ({str(e)[:60]})")
+            return
+        self._results_csv.writerow(CSVExporter.to_row(domain_result))
+        self.csv_stage2_rows += 1
+    
+    async def _scrape_one(self, pages: _PagePool, domain: str, index: int, total: Optional[int]) -> Dict:
+        """Scrape one domain on a pooled page: who.is first, sidn.nl for .nl fallback.
+        
+        Args:
+            pages: Stage 2 page pool
+            domain: Domain name to scrape
+            index: Domain index for progress output and screenshot naming
+            total: Total number of domains in this stage (None while Stage 1 is still feeding it)
+            
+        Returns:
+            Result dictionary with domain information
+        """
+        # Progress lines are collected and printed together so concurrent
+        # scrapes do not interleave their output
+        lines = []
+        position = f"{index}/{total}" if total is not None else f"{index}"
+        header = f"[{position}] {domain:30}"
+        
+        try:
+            async with pages.page() as page:
+                result = await self._scrape_sources(page, domain, index, header, lines)
+        except Exception as e:
+            lines.append(f"{header} ❌ Error: {str(e)[:40]}")
+            result = {
+                'domain': domain,
+                'success': False,
+                'error': str(e)
+            }
+        
+        print('\n'.join(lines))
+        return result
+    
+    async def _scrape_sources(self, page, domain: str, index: int, header: str, lines: List[str]) -> Dict:
+        """Try who.is, then sidn.nl for .nl domains, on one page.
+        
+        Args:
+            page: Pooled Playwright page
+            domain: Domain name to scrape
+            index: Domain index for screenshot naming
+            header: Progress line prefix
+            lines: Progress lines to append to
+            
+        Returns:
+            Result dictionary with domain information
+        """
+        # First try who.is
+        result = await self.scrape_with_playwright(page, domain, index)
+        
+        # If who.is failed and domain is .nl, try sidn.nl
+        if not result['success'] and domain.endswith('.nl'):
+            lines.append(f"{header} ⚠️  No data on who.is")
+            lines.append(f"      🔄 Trying sidn.nl...")
+            header = "     "
+            result = await self.scrape_sidn_nl(page, domain, index)
+        
+        if result['success']:
+            lines.append(f"{header} ✅ Data found ({result.get('data_source', 'unknown')})")
+            if result.get('creation_date'):
+                lines.append(f"      Created: {result['creation_date']}")
+            if result.get('registrar'):
+                lines.append(f"      Registrar: {result['registrar'][:40]}")
+        else:
+            lines.append(f"{header} ⚠️  No data")
+        
+        return result
+    
+    async def _pace_host(self, url: str):
+        """Space out page loads to the same site across concurrent scrapes.
+        
+        Args:
+            url: URL about to be loaded
+        """
+        host = urlsplit(url).hostname or ''
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            wait = self._host_last_request.get(host, 0.0) + settings.playwright_host_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._host_last_request[host] = time.monotonic()
+    
+    async def scrape_sidn_nl(self, page, domain: str, index: int):
         """Scrape .nl domain from sidn.nl website.
         
         Args:
-            browser: Playwright browser instance
+            page: Playwright page to navigate (left open for reuse)
             domain: Domain name to scrape
             index: Domain index for screenshot naming
             
@@ -505,13 +1190,14 @@ Now read the input and return ONLY the JSON described above.
             'parsing_method': 'llm'
         }
         
+        safe_name = f"{index:03d}_{domain.replace('.', '_')}"
+        
         try:
-            page = await browser.new_page()
-            
             # Go to SIDN WHOIS page
             url = f"https://www.sidn.nl/whois"
-            await page.goto(url, wait_until='networkidle', timeout=10000)
-            await page.wait_for_timeout(1000)
+            await self._pace_host(url)
+            # The form is server-rendered; fill() waits for the input itself
+            await page.goto(url, wait_until='domcontentloaded', timeout=10000)
             
             # Find and fill the search input
             # The input field might be named 'domain' or have a specific id
@@ -521,20 +1207,20 @@ Now read the input and return ONLY the JSON described above.
                 # Try alternative selector
                 await page.fill('input[type="text"]', domain)
             
-            await page.wait_for_timeout(500)
-            
             # Submit the form (click search button or press Enter)
             try:
                 await page.click('button[type="submit"]')
             except:
                 await page.press('input[name="domain"]', 'Enter')
             
-            # Wait for results to load
-            await page.wait_for_timeout(1500)
-            
-            # Take screenshot of results
-            screenshot_file = self.screenshots_dir / f"{index:03d}_{domain.replace('.', '_')}_sidn.png"
-            await page.screenshot(path=str(screenshot_file))
+            # Wait for the result block (or the "show data" button) to render
+            try:
+                await page.wait_for_selector(
+                    '.whois-result, .result-table, :text-matches("Registrar|Beheerder|Toon mij", "i")',
+                    timeout=8000
+                )
+            except Exception:
+                pass
             
             # Look for "Toon mij de gegevens" (Show me the data) button/link
             # This might be a button or link, try to click it
@@ -559,20 +1245,19 @@ Now read the input and return ONLY the JSON described above.
                         continue
                 
                 if clicked:
-                    await page.wait_for_timeout(1000)
-                    
-                    # Take another screenshot after clicking
-                    screenshot_file2 = self.screenshots_dir / f"{index:03d}_{domain.replace('.', '_')}_sidn_details.png"
-                    await page.screenshot(path=str(screenshot_file2))
+                    try:
+                        await page.wait_for_load_state('networkidle', timeout=5000)
+                    except Exception:
+                        pass
                 
             except Exception as e:
                 print(f"      ⚠️  Could not click 'Toon mij de gegevens': {str(e)[:50]}")
             
             # Get the page content after clicking (or without if button not found)
-            page_text = await page.inner_text('body')
-            
-            # Use LLM to parse the content (same prompt as who.is)
-            llm_result = await self.parse_with_llm(page_text, domain, url)
+            # and parse it with the LLM (same prompt as who.is); the full text
+            # is kept for the regex fallback
+            llm_text, page_text = await self._page_texts(page)
+            llm_result = await self.parse_with_llm(llm_text, domain, url)
             
             if llm_result:
                 result.update(llm_result)
@@ -585,7 +1270,8 @@ Now read the input and return ONLY the JSON described above.
                     result['success'] = True
                     result['parsing_method'] = 'regex'
             
-            await page.close()
+            if not result['success'] or settings.debug:
+                await self._save_screenshot(page, f"{safe_name}_sidn.jpg")
             
         except Exception as e:
             result['error'] = str(e)
@@ -593,6 +1279,32 @@ Now read the input and return ONLY the JSON described above.
         
         return result
     
+    async def _save_screenshot(self, page, filename: str):
+        """Save a diagnostic screenshot of a page (no data found, or debug mode).
+        
+        Args:
+            page: Playwright page
+            filename: File name inside the screenshots directory
+        """
+        await page.screenshot(path=str(self.screenshots_dir / filename), **_SCREENSHOT_OPTIONS)
+        self.screenshot_count += 1
+    
+    async def _page_texts(self, page) -> Tuple[str, str]:
+        """Get a page's LLM input and full body text with one evaluate call.
+        
+        The LLM input prefers the WHOIS results container and falls back to
+        the body text.
+        
+        Args:
+            page: Playwright page
+            
+        Returns:
+            Tuple of (cleaned, length-capped LLM text, full body text)
+        """
+        container_text, page_text = await page.evaluate(_PAGE_TEXT_JS, _LLM_TEXT_SELECTORS)
+        llm_text = _clean_for_llm(container_text.strip() or page_text, settings.llm_max_input_chars)
+        return llm_text, page_text
+    
     def _parse_sidn_with_regex(self, page_text: str) -> Dict:
         """Parse SIDN page content with regex as fallback.
         
@@ -609,34 +1321,23 @@ Now read the input and return ONLY the JSON described above.
             'nameservers': []
         }
         
-        # SIDN might have Dutch labels
+        # SIDN might have Dutch labels; labels are listed in order of preference
+        fields = _first_matches(_SIDN_COMBINED, page_text, _SIDN_FIELDS)
+        
         # Registrar
-        registrar_patterns = [
-            r'Registrar:\s*(.+)',
-            r'Beheerder:\s*(.+)',
-        ]
-        for pattern in registrar_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                result['registrar'] = match.group(1).strip()[:100]
-                break
+        registrar = fields.get('registrar') or fields.get('beheerder')
+        if registrar:
+            result['registrar'] = registrar.strip()[:100]
         
         # Creation date (various date formats)
-        date_patterns = [
-            r'Creation Date:\s*(\d{4}-\d{2}-\d{2})',
-            r'Aangemaakt:\s*(\d{4}-\d{2}-\d{2})',
-            r'Date registered:\s*(\d{4}-\d{2}-\d{2})',
-        ]
-        for pattern in date_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                result['creation_date'] = match.group(1)
-                break
+        result['creation_date'] = (
+            fields.get('creation_date') or fields.get('aangemaakt') or fields.get('date_registered')
+        )
         
         return result
     
-    async def scrape_with_playwright(self, browser, domain: str, index: int):
-        """Scrape single domain with Playwright."""
+    async def scrape_with_playwright(self, page, domain: str, index: int):
+        """Scrape single domain with Playwright on the given page."""
         
         result = {
             'domain': domain,
@@ -651,65 +1352,66 @@ Now read the input and return ONLY the JSON described above.
         }
         
         try:
-            page = await browser.new_page()
-            
             url = f"https://who.is/whois/{domain}"
-            await page.goto(url, wait_until='networkidle', timeout=30000)
-            await page.wait_for_timeout(2000)
-            
-            # Take screenshot
-            screenshot_file = self.screenshots_dir / f"{index:03d}_{domain.replace('.', '_')}.png"
-            await page.screenshot(path=str(screenshot_file))
-            
-            # Get page content
-            page_text = await page.inner_text('body')
+            await self._pace_host(url)
+            # who.is renders the WHOIS record server-side, so the DOM is
+            # complete without waiting for trailing network activity
+            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
             
-            # Try LLM parsing first
-            llm_result = await self.parse_with_llm(page_text, domain, url)
+            # Get page content; try LLM parsing first on the cleaned text, the
+            # full text is kept for the regex fallback
+            llm_text, page_text = await self._page_texts(page)
+            llm_result = await self.parse_with_llm(llm_text, domain, url)
             
             if llm_result:
                 # Use LLM results
                 result.update(llm_result)
                 result['parsing_method'] = 'llm'
                 result['success'] = True
-                await page.close()
-                return result
-            
-            # Fallback to regex parsing if LLM not available or failed
-            # Extract creation date
-            created_match = re.search(r'Created\s+(\d{1,2}/\d{1,2}/\d{4})', page_text)
-            if created_match:
-                result['creation_date'] = created_match.group(1)
-                result['success'] = True
-            
-            # Extract registrar
-            registrar_match = re.search(r'Registrar:\s*(.+)', page_text, re.IGNORECASE)
-            if registrar_match:
-                result['registrar'] = registrar_match.group(1).strip()[:100]
-                result['success'] = True
-            
-            # Extract registrant
-            registrant_patterns = [
-                r'Registrant\s+Organization:\s*(.+)',
-                r'Organization:\s*(.+)',
-            ]
-            
-            for pattern in registrant_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    org = match.group(1).strip()
-                    if 'privacy' not in org.lower() and 'redacted' not in org.lower():
-                        result['registrant_org'] = org[:100]
-                        result['success'] = True
-                        break
+            else:
+                # Fallback to regex parsing if LLM not available or failed
+                fields = self._parse_whois_with_regex(page_text)
+                result.update(fields)
+                result['success'] = any(fields.values())
             
-            await page.close()
+            if not result['success'] or settings.debug:
+                await self._save_screenshot(page, f"{index:03d}_{domain.replace('.', '_')}.jpg")
             
         except Exception as e:
             result['error'] = str(e)
         
         return result
     
+    def _parse_whois_with_regex(self, page_text: str) -> Dict:
+        """Parse who.is page content with regex as fallback.
+        
+        Args:
+            page_text: Page text content
+            
+        Returns:
+            Dictionary with the fields that were found
+        """
+        result = {}
+        fields = _first_matches(_WHOIS_COMBINED, page_text, _WHOIS_FIELDS)
+        
+        # Extract creation date
+        if fields.get('created'):
+            result['creation_date'] = fields['created']
+        
+        # Extract registrar
+        if fields.get('registrar'):
+            result['registrar'] = fields['registrar'].strip()[:100]
+        
+        # Extract registrant
+        for name in ('registrant_org', 'org'):
+            if name in fields:
+                org = fields[name].strip()
+                if 'privacy' not in org.lower() and 'redacted' not in org.lower():
+                    result['registrant_org'] = org[:100]
+                    break
+        
+        return result
+    
     async def stage3_txt_verification(self, uncertain_domains: List[str]):
         """Stage 3: TXT verification for uncertain ownership."""
         
@@ -717,66 +1419,59 @@ Now read the input and return ONLY the JSON described above.
             print("\n✅ No domains need TXT verification")
             return
         
-        print("\n" + "=" * 80)
-        print("🔐 STAGE 3: TXT Verification Setup")
-        print("=" * 80)
+        _print_banner("🔐 STAGE 3: TXT Verification Setup")
         
         print(f"\n📝 Creating TXT verification tasks for {len(uncertain_domains)} domains...")
         
         txt_tasks = []
         
-        for i, domain in enumerate(uncertain_domains, 1):
-            print(f"[{i}/{len(uncertain_domains)}] {domain:30}", end=" ", flush=True)
+        # All inserts share one transaction, so the whole stage costs a single commit
+        with self.txt_manager.transaction():
+            for i, domain in enumerate(uncertain_domains, 1):
+                prefix = f"[{i}/{len(uncertain_domains)}] {domain:30}"
             
-            try:
-                # Create TXT verification task
-                task_id, token = self.txt_manager.create_txt_task(
-                    domain=domain,
-                    case_id=self.run_id,
-                    max_attempts=1
-                )
+                try:
+                    # Create TXT verification task
+                    task_id, token = self.txt_manager.create_txt_task(
+                        domain=domain,
+                        case_id=self.run_id,
+                        max_attempts=1
+                    )
                 
-                txt_tasks.append({
-                    'domain': domain,
-                    'task_id': task_id,
-                    'token': token,
-                    'txt_name': '@',
-                    'instructions': f"Add TXT record: @ = {token}"
-                })
+                    txt_tasks.append({
+                        'domain': domain,
+                        'task_id': task_id,
+                        'token': token,
+                        'txt_name': '@',
+                        'instructions': f"Add TXT record: @ = {token}"
+                    })
                 
-                print(f"✅ Task created")
-                print(f"      Token: {token}")
+                    print(f"{prefix} ✅ Task created\n      Token: {token}")
                 
-                self.stage3_results.append({
-                    'domain': domain,
-                    'task_id': task_id,
-                    'token': token
-                })
+                    self.stage3_results.append({
+                        'domain': domain,
+                        'task_id': task_id,
+                        'token': token
+                    })
                 
-            except Exception as e:
-                print(f"❌ Error: {str(e)[:40]}")
+                except Exception as e:
+                    print(f"{prefix} ❌ Error: {str(e)[:40]}")
         
-        # Save Stage 3 results
+        # Save Stage 3 results and the instructions file; both grow with the
+        # number of tasks, so they are written concurrently off the event loop
         stage3_file = self.intermediate_dir / "stage3_txt_tasks.json"
-        with open(stage3_file, 'w', encoding='utf-8') as f:
-            json.dump(txt_tasks, f, indent=2)
-        
-        # Create instructions file
         instructions_file = self.results_dir / "TXT_VERIFICATION_INSTRUCTIONS.txt"
-        with open(instructions_file, 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write("TXT Verification Instructions\n")
-            f.write(f"Run ID: {self.run_id}\n")
-            f.write("=" * 80 + "\n\n")
-            
-            for task in txt_tasks:
-                f.write(f"Domain: {task['domain']}\n")
-                f.write(f"  Add DNS TXT record:\n")
-                f.write(f"  Host/Name: {task['txt_name']}\n")
-                f.write(f"  Type: TXT\n")
-                f.write(f"  Value: {task['token']}\n")
-                f.write(f"  Task ID: {task['task_id']}\n")
-                f.write("\n" + "-" * 80 + "\n\n")
+        header = (
+            _RULE + "\n"
+            "TXT Verification Instructions\n"
+            f"Run ID: {self.run_id}\n"
+            + _RULE + "\n\n"
+        )
+        instructions = header + ''.join(_TXT_INSTRUCTION_TEMPLATE.format(**task) for task in txt_tasks)
+        await asyncio.gather(
+            asyncio.to_thread(self._write_json, stage3_file, txt_tasks),
+            asyncio.to_thread(instructions_file.write_text, instructions, encoding='utf-8')
+        )
         
         # Save metadata
         self.save_metadata('3', {
@@ -793,56 +1488,55 @@ Now read the input and return ONLY the JSON described above.
         
         return txt_tasks
     
-    def check_txt_via_dig(self, domain: str, expected_token: str) -> Tuple[bool, Optional[str], Optional[str]]:
-        """Check TXT record using dig command.
+    def _record_txt_attempt(self, verified: List[Tuple], failed: List[Tuple]):
+        """Write one polling attempt's outcomes to the database in a single transaction.
         
         Args:
-            domain: Domain name to check
-            expected_token: Expected verification token
+            verified: (task_id, domain, dns_output, verified_at) tuples
+            failed: (task_id, dns_output, error, checked_at) tuples
+        """
+        db = self.txt_manager.db
+        with db.transaction():
+            if verified:
+                db.bulk_mark_verified((task_id, dns_output, now) for task_id, _, dns_output, now in verified)
+                self.txt_manager.bulk_update_domains_verified(
+                    ((domain, now) for _, domain, _, now in verified), self.run_id
+                )
+            if failed:
+                db.bulk_increment_attempts(failed)
+    
+    def _next_poll_delay(self, attempt: int, poll_interval: float,
+                         progress: bool, pending_tasks: List[Dict]) -> float:
+        """Choose how long to wait before the next TXT polling attempt.
+        
+        The delay backs off exponentially while nothing verifies. Right after
+        a verification other records are often about to land, so the next
+        poll comes sooner. It never polls until at least one pending answer
+        can change (the soonest cached DNS answer has expired, or one is not
+        cached), since an earlier poll could not see anything new.
+        
+        Args:
+            attempt: Attempt that just finished (1-based)
+            poll_interval: Base delay in seconds
+            progress: Whether any domain verified in that attempt
+            pending_tasks: Tasks still waiting for verification
             
         Returns:
-            Tuple of (success, dns_raw_output, error_message)
+            Seconds to sleep
         """
-        try:
-            # Use Cloudflare DNS (1.1.1.1) with dig
-            cmd = ["dig", "@1.1.1.1", "TXT", domain, "+short"]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            output = result.stdout.strip()
-            
-            # Check if there's any output
-            if not output:
-                return False, output, "NO_ANSWER"
-            
-            # Parse TXT records
-            lines = output.splitlines()
-            for line in lines:
-                # Remove quotes from TXT record value
-                txt_value = line.strip().strip('"')
-                
-                # Check if token is present
-                if expected_token in txt_value:
-                    return True, output, None
-            
-            return False, output, "TOKEN_NOT_FOUND"
-            
-        except subprocess.TimeoutExpired:
-            return False, None, "TIMEOUT"
-        except FileNotFoundError:
-            return False, None, "DIG_NOT_INSTALLED"
-        except Exception as e:
-            return False, None, str(e)
+        if progress:
+            delay = settings.txt_min_poll_interval
+        else:
+            delay = poll_interval * 2 ** (attempt - 1)
+        fresh_in = self.txt_checker.seconds_until_fresh(task['domain'] for task in pending_tasks)
+        ceiling = max(poll_interval, settings.txt_max_poll_interval)
+        return min(max(delay, fresh_in, settings.txt_min_poll_interval), ceiling)
     
     async def stage4_txt_verification_execution(self, txt_tasks: List[Dict], 
                                                 wait_time: int = 300,
                                                 max_attempts: int = 1,
-                                                poll_interval: int = 60):
+                                                poll_interval: int = 60,
+                                                dns_prefetch: bool = True):
         """Stage 4: Execute TXT verification by checking DNS records.
         
         Args:
@@ -850,42 +1544,60 @@ Now read the input and return ONLY the JSON described above.
             wait_time: Initial wait time before first check (seconds, default: 300 = 5 minutes)
             max_attempts: Maximum number of polling attempts (default: 1)
             poll_interval: Time between polling attempts (seconds, default: 60 = 1 minute)
+            dns_prefetch: Warm resolver caches for the domains during the initial wait
             
         Note:
-            Total wait time = wait_time + (max_attempts * poll_interval)
-            Default: 5 minutes + (1 * 1 minute) = 6 minutes total
+            The delay between attempts starts at poll_interval and doubles up to
+            settings.txt_max_poll_interval; see _next_poll_delay()
         """
         
         if not txt_tasks:
             print("\n⏭️  No TXT verification tasks to execute, skipping Stage 4")
             return
         
-        print("\n" + "=" * 80)
-        print("🔐 STAGE 4: TXT Verification Execution (DNS Checking)")
-        print("=" * 80)
+        _print_banner("🔐 STAGE 4: TXT Verification Execution (DNS Checking)")
+        
+        # Offline, every check would wait out its full DNS timeout
+        if not await self.txt_checker.is_reachable():
+            print("\n⚠️  DNS resolvers unreachable (offline?), skipping TXT verification")
+            return
         
         print(f"\n📋 Will verify {len(txt_tasks)} domains")
         print(f"⏱️  Initial wait: {wait_time} seconds")
         print(f"🔄 Max attempts: {max_attempts} (every {poll_interval}s)")
         print()
         
-        # Display instructions
-        print("=" * 80)
-        print("📝 INSTRUCTIONS: Please add the following TXT records to your DNS")
-        print("=" * 80)
-        for i, task in enumerate(txt_tasks, 1):
-            print(f"\n[{i}/{len(txt_tasks)}] {task['domain']}")
-            print(f"   Record Type: TXT")
-            print(f"   Host/Name: @ (or leave blank for root domain)")
-            print(f"   Value: {task['token']}")
-        
-        print("\n" + "=" * 80)
-        print(f"⏳ Waiting {wait_time} seconds for DNS records to be added...")
-        print("   (You can add records during this time)")
-        print("=" * 80)
-        
-        # Wait for initial setup time
-        await asyncio.sleep(wait_time)
+        # Display instructions, assembled and printed as one write
+        task_count = len(txt_tasks)
+        print('\n'.join([
+            _RULE,
+            "📝 INSTRUCTIONS: Please add the following TXT records to your DNS",
+            _RULE,
+            *(
+                _TXT_CONSOLE_TEMPLATE.format(index=i, total=task_count, domain=task['domain'], token=task['token'])
+                for i, task in enumerate(txt_tasks, 1)
+            ),
+            "\n" + _RULE,
+            f"⏳ Waiting {wait_time} seconds for DNS records to be added...",
+            "   (You can add records during this time)",
+            _RULE
+        ]))
+        
+        # Wait for initial setup time, warming resolver caches in the meantime
+        if dns_prefetch:
+            await asyncio.gather(
+                asyncio.sleep(wait_time),
+                asyncio.wait_for(
+                    self.txt_checker.prefetch(
+                        [task['domain'] for task in txt_tasks],
+                        concurrency=settings.txt_check_concurrency
+                    ),
+                    timeout=max(wait_time, 1)
+                ),
+                return_exceptions=True
+            )
+        else:
+            await asyncio.sleep(wait_time)
         
         # Start verification
         print("\n🚀 Starting DNS verification...")
@@ -894,49 +1606,89 @@ Now read the input and return ONLY the JSON described above.
         failed_count = 0
         pending_tasks = list(txt_tasks)
         
+        # Outcomes are appended after every attempt, so an interrupted run keeps its progress
+        stage4_file = self.intermediate_dir / "stage4_txt_results.jsonl"
+        stage4_file.unlink(missing_ok=True)
+        
+        interactive = sys.stdout.isatty()
+        
+        # One concurrency cap shared by every polling attempt
+        semaphore = asyncio.Semaphore(settings.txt_check_concurrency)
+        
+        async def check(task: Dict):
+            async with semaphore:
+                return await self.txt_checker.check(task['domain'], task['token'])
+        
         for attempt in range(1, max_attempts + 1):
-            print(f"\n{'=' * 80}")
+            print(f"\n{_RULE}")
             print(f"🔍 Verification Attempt {attempt}/{max_attempts}")
             print(f"📊 Remaining: {len(pending_tasks)} domains")
-            print(f"{'=' * 80}\n")
+            print(f"{_RULE}\n")
             
             still_pending = []
             
-            for i, task in enumerate(pending_tasks, 1):
+            # Resolve every pending domain concurrently, then record results in order
+            checks = await asyncio.gather(
+                *(check(task) for task in pending_tasks),
+                return_exceptions=True
+            )
+            
+            # All checks of an attempt finish together, so one timestamp covers them
+            now = datetime.now(timezone.utc)
+            verified_at = now.isoformat()
+            
+            # Database updates and result rows for this attempt, written once below
+            verified_batch = []
+            failed_batch = []
+            verified_rows = []
+            
+            # Progress is printed in one write per attempt: a line per domain on a
+            # terminal, verified domains plus periodic summaries when redirected
+            progress = []
+            total = len(pending_tasks)
+            
+            for i, (task, outcome) in enumerate(zip(pending_tasks, checks), 1):
                 domain = task['domain']
-                token = task['token']
                 task_id = task['task_id']
                 
-                print(f"[{i}/{len(pending_tasks)}] {domain:30}", end=" ", flush=True)
+                prefix = f"[{i}/{total}] {domain:30}"
                 
-                # Check DNS
-                success, dns_output, error = self.check_txt_via_dig(domain, token)
+                if isinstance(outcome, Exception):
+                    success, dns_output, error = False, None, str(outcome)
+                else:
+                    success, dns_output, error = outcome
                 
                 if success:
-                    print(f"✅ VERIFIED!")
+                    progress.append(f"{prefix} ✅ VERIFIED!")
                     verified_count += 1
                     
-                    # Update database
-                    now = datetime.now(timezone.utc)
-                    self.txt_manager.db.mark_task_verified(task_id, dns_output, now)
-                    self.txt_manager.update_domain_verified(domain, self.run_id, now)
+                    verified_batch.append((task_id, domain, dns_output, now))
                     
-                    # Add to stage4 results
-                    self.stage4_results.append({
+                    verified_rows.append({
                         'domain': domain,
                         'status': 'VERIFIED',
                         'attempt': attempt,
                         'dns_output': dns_output,
-                        'verified_at': now.isoformat()
+                        'verified_at': verified_at
                     })
                     
                 else:
-                    print(f"⏳ Not yet ({error})")
+                    if interactive:
+                        progress.append(f"{prefix} ⏳ Not yet ({error})")
                     still_pending.append(task)
                     
-                    # Update attempt count in database
-                    now = datetime.now(timezone.utc)
-                    self.txt_manager.db.increment_task_attempt(task_id, dns_output, error, now)
+                    failed_batch.append((task_id, dns_output, error, now))
+                
+                if not interactive and (i % self.PROGRESS_EVERY == 0 or i == total):
+                    progress.append(f"[{i}/{total}] ✅ {len(verified_batch)} verified, "
+                                    f"⏳ {len(still_pending)} pending")
+            
+            print('\n'.join(progress))
+            
+            await asyncio.to_thread(self._record_txt_attempt, verified_batch, failed_batch)
+            if verified_rows:
+                await asyncio.to_thread(self._append_jsonl, stage4_file, verified_rows)
+                self.stage4_status['VERIFIED'] += len(verified_rows)
             
             # Update pending list
             pending_tasks = still_pending
@@ -947,22 +1699,18 @@ Now read the input and return ONLY the JSON described above.
             
             # Wait before next attempt (unless last attempt)
             if attempt < max_attempts and pending_tasks:
-                print(f"\n⏳ Waiting {poll_interval} seconds before next attempt...")
-                await asyncio.sleep(poll_interval)
+                delay = self._next_poll_delay(attempt, poll_interval, bool(verified_batch), pending_tasks)
+                print(f"\n⏳ Waiting {delay:.0f} seconds before next attempt...")
+                await asyncio.sleep(delay)
         
         # Mark remaining as failed
         failed_count = len(pending_tasks)
-        for task in pending_tasks:
-            self.stage4_results.append({
-                'domain': task['domain'],
-                'status': 'FAILED',
-                'reason': 'Max attempts reached'
-            })
-        
-        # Save Stage 4 results
-        stage4_file = self.intermediate_dir / "stage4_txt_results.json"
-        with open(stage4_file, 'w', encoding='utf-8') as f:
-            json.dump(self.stage4_results, f, indent=2)
+        if pending_tasks:
+            await asyncio.to_thread(self._append_jsonl, stage4_file, [
+                {'domain': task['domain'], 'status': 'FAILED', 'reason': 'Max attempts reached'}
+                for task in pending_tasks
+            ])
+            self.stage4_status['FAILED'] += failed_count
         
         # Save metadata
         self.save_metadata('4', {
@@ -983,7 +1731,8 @@ Now read the input and return ONLY the JSON described above.
                                     enable_txt_verification: bool = True,
                                     txt_wait_time: int = 30,
                                     txt_max_attempts: int = 1,
-                                    txt_poll_interval: int = 30):
+                                    txt_poll_interval: int = 30,
+                                    dns_prefetch: bool = True):
         """Run the complete 4-stage pipeline.
         
         Args:
@@ -992,39 +1741,55 @@ Now read the input and return ONLY the JSON described above.
             txt_wait_time: Initial wait time before first DNS check (seconds)
             txt_max_attempts: Maximum polling attempts for TXT verification
             txt_poll_interval: Time between polling attempts (seconds)
+            dns_prefetch: Warm resolver caches during the initial TXT wait
         """
         
-        print("=" * 80)
+        print(_RULE)
         print(f"🚀 Complete Domain Verification Pipeline")
         print(f"   Run ID: {self.run_id}")
         print(f"   Data Directory: {self.run_dir}")
-        print("=" * 80)
+        print(_RULE)
         
-        # Copy input file to run directory
+        # Read the input once: the same bytes are copied to the run directory and parsed
+        input_bytes = Path(input_csv).read_bytes()
         input_copy = self.run_dir / "input.csv"
-        shutil.copy(input_csv, input_copy)
+        input_copy.write_bytes(input_bytes)
         print(f"\n📥 Input copied to: {input_copy}")
         
-        # Read domains from CSV
-        domains = []
-        with open(input_csv, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if len(row) >= 2 and row[1]:
-                    domain = row[1].strip()
-                    if domain and '.' in domain:
-                        domains.append(domain)
-        
+        # Domains from the second column, normalized and de-duplicated in input
+        # order; a header row, if any, fails the hostname check
+        rows = csv.reader(io.StringIO(input_bytes.decode('utf-8'), newline=''))
+        normalized = (_normalize_domain(row[1]) for row in rows if len(row) >= 2 and row[1])
+        domains = list(dict.fromkeys(d for d in normalized if _DOMAIN_RE.fullmatch(d)))
         self.domains = domains
         print(f"📋 Total domains: {len(domains)}")
         
         start_time = datetime.now()
         
-        # Stage 1: API Lookup
-        stage1_failed = await self.stage1_api_lookup(domains)
-        
-        # Stage 2: Playwright Scraping
-        stage2_failed = await self.stage2_playwright_scraping(stage1_failed)
+        # The combined results CSV is filled as Stage 1 and Stage 2 resolve
+        # domains, so a crash later in the run still leaves them on disk
+        results_csv_out = open(self.results_csv, 'w', encoding='utf-8', newline='',
+                               buffering=self.WRITE_BUFFER)
+        self._results_csv = csv.writer(results_csv_out)
+        self._results_csv.writerow(CSVExporter.FIELD_ORDER)
+        try:
+            # Stages 1 and 2 overlap: Stage 2 scrapes each API failure as soon
+            # as Stage 1 reports it instead of waiting for the whole stage
+            failed_queue = asyncio.Queue()
+            stage2_task = asyncio.create_task(self.stage2_playwright_scraping(failed_queue))
+            try:
+                # Stage 1: API Lookup
+                await self.stage1_api_lookup(domains, failed_queue)
+                results_csv_out.flush()
+            except BaseException:
+                stage2_task.cancel()
+                raise
+            
+            # Stage 2: Playwright Scraping
+            stage2_failed = await stage2_task
+        finally:
+            self._results_csv = None
+            results_csv_out.close()
         
         # Stage 3: TXT Verification Setup
         txt_tasks = await self.stage3_txt_verification(stage2_failed)
@@ -1035,7 +1800,8 @@ Now read the input and return ONLY the JSON described above.
                 txt_tasks=txt_tasks,
                 wait_time=txt_wait_time,
                 max_attempts=txt_max_attempts,
-                poll_interval=txt_poll_interval
+                poll_interval=txt_poll_interval,
+                dns_prefetch=dns_prefetch
             )
         
         # Generate final report
@@ -1043,9 +1809,7 @@ Now read the input and return ONLY the JSON described above.
         
         await self.generate_final_report(total_time)
         
-        print("\n" + "=" * 80)
-        print("✅ PIPELINE COMPLETE!")
-        print("=" * 80)
+        _print_banner("✅ PIPELINE COMPLETE!")
         print(f"\n📁 All results saved in: {self.run_dir}")
         print(f"   📊 Final report: results/FINAL_REPORT.txt")
         print(f"   📸 Screenshots: screenshots/")
@@ -1054,85 +1818,84 @@ Now read the input and return ONLY the JSON described above.
     async def generate_final_report(self, total_time: float):
         """Generate comprehensive final report."""
         
-        report_file = self.results_dir / "FINAL_REPORT.txt"
+        report_file = self.report_file
+        report_json = self.report_json
         
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
+        # Compute every statistic once; the three writers below only format them
+        total_domains = len(self.domains)
+        successful_stage2 = sum(1 for r in self.stage2_results if r.get('success'))
+        verified_by_txt = self.stage4_status['VERIFIED']
+        failed_by_txt = self.stage4_status['FAILED']
+        stage4_processed = sum(self.stage4_status.values())
+        total_resolved = self.stage1_count + successful_stage2 + verified_by_txt
+        overall_rate = _pct(total_resolved, total_domains)
+        timestamp = datetime.now().isoformat()
+        
+        def write_txt():
+            # Assemble the whole report in memory and write it in one call
+            f = io.StringIO()
+            f.write(_RULE + "\n")
             f.write("COMPLETE DOMAIN VERIFICATION PIPELINE - FINAL REPORT\n")
-            f.write("=" * 80 + "\n\n")
+            f.write(_RULE + "\n\n")
             
             f.write(f"Run ID: {self.run_id}\n")
-            f.write(f"Timestamp: {datetime.now().isoformat()}\n")
+            f.write(f"Timestamp: {timestamp}\n")
             f.write(f"Total Processing Time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)\n")
-            f.write(f"Total Domains: {len(self.domains)}\n\n")
+            f.write(f"Total Domains: {total_domains}\n\n")
             
-            f.write("-" * 80 + "\n")
+            f.write(_THIN_RULE + "\n")
             f.write("STAGE 1: RDAP/WHOIS API LOOKUP\n")
-            f.write("-" * 80 + "\n")
-            f.write(f"Successful: {len(self.stage1_results)}\n")
-            f.write(f"Failed: {len(self.domains) - len(self.stage1_results)}\n")
-            f.write(f"Success Rate: {len(self.stage1_results)/len(self.domains)*100:.1f}%\n\n")
+            f.write(_THIN_RULE + "\n")
+            f.write(f"Successful: {self.stage1_count}\n")
+            f.write(f"Failed: {total_domains - self.stage1_count}\n")
+            f.write(f"Success Rate: {_pct(self.stage1_count, total_domains)}\n\n")
             
-            f.write("-" * 80 + "\n")
+            f.write(_THIN_RULE + "\n")
             f.write("STAGE 2: PLAYWRIGHT SCRAPING\n")
-            f.write("-" * 80 + "\n")
-            successful_stage2 = sum(1 for r in self.stage2_results if r.get('success'))
+            f.write(_THIN_RULE + "\n")
             f.write(f"Processed: {len(self.stage2_results)}\n")
             f.write(f"Successful: {successful_stage2}\n")
-            f.write(f"Screenshots Captured: {len(list(self.screenshots_dir.glob('*.png')))}\n\n")
+            f.write(f"Screenshots Captured: {self.screenshot_count}\n\n")
             
-            f.write("-" * 80 + "\n")
+            f.write(_THIN_RULE + "\n")
             f.write("STAGE 3: TXT VERIFICATION SETUP\n")
-            f.write("-" * 80 + "\n")
+            f.write(_THIN_RULE + "\n")
             f.write(f"Tasks Created: {len(self.stage3_results)}\n\n")
             
             # Stage 4 stats
-            if self.stage4_results:
-                f.write("-" * 80 + "\n")
+            if stage4_processed:
+                f.write(_THIN_RULE + "\n")
                 f.write("STAGE 4: TXT VERIFICATION EXECUTION\n")
-                f.write("-" * 80 + "\n")
-                verified_count = sum(1 for r in self.stage4_results if r.get('status') == 'VERIFIED')
-                failed_count = sum(1 for r in self.stage4_results if r.get('status') == 'FAILED')
-                f.write(f"Processed: {len(self.stage4_results)}\n")
-                f.write(f"Verified: {verified_count}\n")
-                f.write(f"Failed: {failed_count}\n")
-                if len(self.stage4_results) > 0:
-                    f.write(f"Verification Rate: {verified_count/len(self.stage4_results)*100:.1f}%\n")
+                f.write(_THIN_RULE + "\n")
+                f.write(f"Processed: {stage4_processed}\n")
+                f.write(f"Verified: {verified_by_txt}\n")
+                f.write(f"Failed: {failed_by_txt}\n")
+                f.write(f"Verification Rate: {_pct(verified_by_txt, stage4_processed)}\n")
                 f.write("\n")
             
-            f.write("-" * 80 + "\n")
+            f.write(_THIN_RULE + "\n")
             f.write("OVERALL SUMMARY\n")
-            f.write("-" * 80 + "\n")
-            total_resolved = len(self.stage1_results) + successful_stage2
-            verified_by_txt = sum(1 for r in self.stage4_results if r.get('status') == 'VERIFIED')
-            total_resolved += verified_by_txt
-            
-            f.write(f"Resolved by API (Stage 1): {len(self.stage1_results)}\n")
+            f.write(_THIN_RULE + "\n")
+            f.write(f"Resolved by API (Stage 1): {self.stage1_count}\n")
             f.write(f"Resolved by Playwright (Stage 2): {successful_stage2}\n")
             f.write(f"Resolved by TXT (Stage 4): {verified_by_txt}\n")
-            f.write(f"Total Resolved: {total_resolved}/{len(self.domains)} ({total_resolved/len(self.domains)*100:.1f}%)\n")
+            f.write(f"Total Resolved: {total_resolved}/{total_domains} ({overall_rate})\n")
             
             pending_txt = len(self.stage3_results) - verified_by_txt
             if pending_txt > 0:
                 f.write(f"Still Pending TXT Verification: {pending_txt}\n")
             
-            f.write(f"Overall Success Rate: {total_resolved/len(self.domains)*100:.1f}%\n")
-        
-        # Also save as JSON
-        report_json = self.results_dir / "FINAL_REPORT.json"
-        
-        verified_by_txt = sum(1 for r in self.stage4_results if r.get('status') == 'VERIFIED')
-        successful_stage2 = sum(1 for r in self.stage2_results if r.get('success'))
-        total_resolved = len(self.stage1_results) + successful_stage2 + verified_by_txt
+            f.write(f"Overall Success Rate: {overall_rate}\n")
+            report_file.write_text(f.getvalue(), encoding='utf-8')
         
         report_data = {
             'run_id': self.run_id,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'total_time_seconds': total_time,
-            'total_domains': len(self.domains),
+            'total_domains': total_domains,
             'stage1': {
-                'successful': len(self.stage1_results),
-                'failed': len(self.domains) - len(self.stage1_results)
+                'successful': self.stage1_count,
+                'failed': total_domains - self.stage1_count
             },
             'stage2': {
                 'processed': len(self.stage2_results),
@@ -1143,64 +1906,74 @@ Now read the input and return ONLY the JSON described above.
             },
             'overall': {
                 'total_resolved': total_resolved,
-                'success_rate': total_resolved / len(self.domains) * 100 if self.domains else 0
+                'success_rate': total_resolved / total_domains * 100 if total_domains else 0
             }
         }
         
         # Add stage4 data if available
-        if self.stage4_results:
-            failed_count = sum(1 for r in self.stage4_results if r.get('status') == 'FAILED')
+        if stage4_processed:
             report_data['stage4'] = {
-                'processed': len(self.stage4_results),
+                'processed': stage4_processed,
                 'verified': verified_by_txt,
-                'failed': failed_count,
-                'verification_rate': verified_by_txt / len(self.stage4_results) * 100 if self.stage4_results else 0
+                'failed': failed_by_txt,
+                'verification_rate': verified_by_txt / stage4_processed * 100
             }
         
-        with open(report_json, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2)
-        
-        # Combine Stage 1 and Stage 2 successful results for CSV export
-        all_successful_results = list(self.stage1_results)
-        
-        # Add Stage 2 Playwright successful results
-        for stage2_result in self.stage2_results:
-            if stage2_result.get('success'):
-                # Convert Stage 2 result to DomainResult format
-                domain_result = DomainResult(
-                    domain=stage2_result['domain'],
-                    registrant_organization=stage2_result.get('registrant_org'),
-                    registrar=stage2_result.get('registrar'),
-                    registry=stage2_result.get('registry'),
-                    creation_date=stage2_result.get('creation_date'),
-                    expiry_date=stage2_result.get('expiry_date'),
-                    nameservers=stage2_result.get('nameservers', []),
-                    data_source=stage2_result.get('data_source', 'Playwright'),
-                    timestamp=datetime.now(timezone.utc)
-                )
-                all_successful_results.append(domain_result)
-        
-        # Save combined results as CSV
-        csv_file = self.results_dir / f"all_results_{self.run_id}.csv"
-        CSVExporter.save_to_file(all_successful_results, str(csv_file))
+        # The two reports are independent, so write them concurrently off the
+        # event loop; the results CSV was written during Stages 1-2
+        await asyncio.gather(
+            asyncio.to_thread(write_txt),
+            asyncio.to_thread(self._write_json, report_json, report_data)
+        )
         
         print(f"\n📄 Final report generated:")
         print(f"   {report_file}")
         print(f"   {report_json}")
         print(f"\n📊 CSV exported:")
-        print(f"   Total domains in CSV: {len(all_successful_results)}")
-        print(f"   - From Stage 1 (API): {len(self.stage1_results)}")
-        print(f"   - From Stage 2 (Playwright): {sum(1 for r in self.stage2_results if r.get('success'))}")
+        print(f"   Total domains in CSV: {self.csv_stage1_rows + self.csv_stage2_rows}")
+        print(f"   - From Stage 1 (API): {self.csv_stage1_rows}")
+        print(f"   - From Stage 2 (Playwright): {self.csv_stage2_rows}")
 
 
-async def main():
-    """Main entry point."""
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line options.
+    
+    Args:
+        argv: Arguments to parse (defaults to sys.argv)
+        
+    Returns:
+        Parsed options
+    """
+    parser = argparse.ArgumentParser(description="Run the complete 4-stage domain verification pipeline.")
+    parser.add_argument("--input", default="../Houthoff-Challenge_Domain-Names.csv",
+                        help="input CSV with domains in the second column")
+    parser.add_argument("--no-deepseek-prompt", action="store_true",
+                        help="continue with regex parsing without asking when DeepSeek is not configured")
+    parser.add_argument("--enable-txt", action=argparse.BooleanOptionalAction, default=True,
+                        help="run Stage 4 TXT verification")
+    parser.add_argument("--txt-wait", type=int, default=30,
+                        help="seconds to wait before the first DNS check")
+    parser.add_argument("--txt-attempts", type=int, default=1,
+                        help="maximum TXT polling attempts")
+    parser.add_argument("--txt-interval", type=int, default=30,
+                        help="seconds between TXT polling attempts")
+    parser.add_argument("--no-dns-prefetch", dest="dns_prefetch", action="store_false",
+                        help="don't warm resolver caches during the initial TXT wait")
+    parser.add_argument("--pretty", action="store_true",
+                        help="indent JSON outputs for debugging")
+    return parser.parse_args(argv)
+
+
+async def main(args: argparse.Namespace):
+    """Main entry point.
+    
+    Args:
+        args: Options from parse_args()
+    """
     
     # Check DeepSeek API configuration
     if not settings.deepseek_api_key:
-        print("\n" + "=" * 80)
-        print("💡 Notice: DeepSeek API not configured")
-        print("=" * 80)
+        _print_banner("💡 Notice: DeepSeek API not configured")
         print("Currently will use regex parsing (accuracy ~70%)")
         print()
         print("To enable AI smart parsing (accuracy improves to 75-80%):")
@@ -1209,12 +1982,14 @@ async def main():
         print("  3. Or create .env file: echo 'DEEPSEEK_API_KEY=sk-xxx' > .env")
         print()
         print("Cost: ~¥0.15/75 domains (very cheap)")
-        print("=" * 80)
-        
-        response = input("\nContinue with regex parsing? (Y/n): ").strip().lower()
-        if response == 'n':
-            print("\nPlease configure DeepSeek API and run again")
-            return
+        print(_RULE)
+        
+        # Only ask when someone can answer; unattended runs continue with regex parsing
+        if not args.no_deepseek_prompt and sys.stdin.isatty():
+            response = input("\nContinue with regex parsing? (Y/n): ").strip().lower()
+            if response == 'n':
+                print("\nPlease configure DeepSeek API and run again")
+                return
         print()
     else:
         print(f"\n✅ DeepSeek API configured, will use AI smart parsing")
@@ -1223,19 +1998,35 @@ async def main():
     # Generate run ID
     run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    # Input CSV
-    input_csv = "../Houthoff-Challenge_Domain-Names.csv"
+    input_csv = args.input
     
     if not Path(input_csv).exists():
         print(f"❌ Error: Input file not found: {input_csv}")
         return
     
     # Create and run pipeline
-    pipeline = CompleteDomainPipeline(run_id)
-    await pipeline.run_complete_pipeline(input_csv)
+    pipeline = CompleteDomainPipeline(run_id, pretty_json=args.pretty)
+    try:
+        await pipeline.run_complete_pipeline(
+            input_csv,
+            enable_txt_verification=args.enable_txt,
+            txt_wait_time=args.txt_wait,
+            txt_max_attempts=args.txt_attempts,
+            txt_poll_interval=args.txt_interval,
+            dns_prefetch=args.dns_prefetch
+        )
+    finally:
+        await pipeline.aclose()
     
     print(f"\n🎉 Complete! Check results in: data/run_{run_id}/")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    # uvloop is not available on Windows; fall back to the stock asyncio loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main(args))
+    else:
+        uvloop.run(main(args))
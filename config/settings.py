@@ -22,6 +22,8 @@ class Settings(BaseSettings):
     # Server Configuration
     host: str = "0.0.0.0"
     port: int = 8000
+    uvicorn_reload: bool = False  # Enable the file-watching reloader (development only)
+    uvicorn_workers: int = 1
     
     # CORS Settings
     cors_origins: list = ["*"]  # Configure appropriately for production
@@ -43,12 +45,47 @@ class Settings(BaseSettings):
     exports_dir: str = "./data/exports"
     evidence_dir: str = "./data/evidence"
     
+    # DeepSeek HTTP Client Configuration
+    deepseek_timeout: float = 60.0
+    deepseek_httpx_keepalive: int = 20  # set to 0 to disable connection reuse
+    deepseek_httpx_max_connections: int = 100
+    
+    # LLM Response Cache Configuration
+    llm_cache_enabled: bool = True
+    llm_cache_dir: str = "./data/.llm_cache"
+    llm_cache_ttl: int = 3600  # seconds in the in-memory tier
+    llm_cache_maxsize: int = 1024
+    llm_cache_disk_ttl: int = 604800  # seconds an entry stays in the on-disk tier
+    llm_cache_version: str = "1"  # bump when the parsing prompt changes
+    llm_max_input_chars: int = 8000  # page text sent to the LLM is capped at this length
+    llm_batch_size: int = 5  # pages parsed per LLM request, capped at playwright_concurrency (1 disables batching)
+    llm_batch_window: float = 0.5  # seconds to wait for a batch to fill
+    
     # RDAP Client Configuration
     rdap_timeout: float = 30.0
+    rdap_concurrency: int = 10  # concurrent lookups in pipeline Stage 1
+    rdap_host_interval: float = 0.2  # minimum seconds between requests to the same host (5 req/s)
+    rdap_host_concurrency: int = 4  # maximum requests in flight to the same RDAP/WHOIS host
+    rdap_cache_enabled: bool = True
+    rdap_cache_path: str = "./data/rdap_cache.db"
+    rdap_cache_ttl: int = 86400  # seconds a successful response is reused across runs
+    rdap_cache_negative_ttl: int = 3600  # seconds a "not found" lookup is cached before retrying
+    
+    # Playwright Scraping Configuration
+    playwright_concurrency: int = 4  # concurrent browser contexts in pipeline Stage 2
+    playwright_host_interval: float = 1.0  # minimum seconds between page loads on the same site
+    playwright_block_resources: bool = True  # skip images, fonts, media, CSS and analytics
     
     # TXT Verification Configuration
     txt_verification_max_attempts: int = 60
     txt_verification_check_interval: int = 60  # seconds
+    txt_dns_nameservers: list = ["1.1.1.1", "8.8.8.8", "9.9.9.9"]  # resolvers queried for TXT records
+    txt_dns_hedge: bool = True  # query all resolvers in parallel; first to see the token wins
+    txt_dns_lifetime: float = 5.0  # seconds per TXT query
+    txt_check_concurrency: int = 50  # concurrent TXT lookups per polling round
+    txt_cache_max_ttl: int = 300  # seconds; cap on reusing a TXT answer between polls
+    txt_min_poll_interval: int = 10  # seconds; shortest wait between Stage 4 attempts
+    txt_max_poll_interval: int = 600  # seconds; cap on the exponential backoff between attempts
     
     # Legal Intelligence Configuration
     expiry_threshold_months: int = 6
@@ -62,16 +99,18 @@ class Settings(BaseSettings):
         extra = "allow"
     
     def __init__(self, **kwargs):
-        """Initialize settings and create necessary directories."""
+        """Initialize settings.
+        
+        Loading settings has no filesystem side effects; the application
+        calls ensure_directories() once at startup.
+        """
         super().__init__(**kwargs)
         
         # Fallback so DeepSeek works even when environment variables are missing
         if not self.deepseek_api_key:
             self.deepseek_api_key = DEEPSEEK_FALLBACK_KEY
-        
-        self._ensure_directories()
     
-    def _ensure_directories(self):
+    def ensure_directories(self):
         """Ensure all required directories exist."""
         directories = [
             self.data_dir,
@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for production deployments.
+
+Runs the FastAPI app under uvicorn workers, one event loop per process:
+    gunicorn app:app -c gunicorn.conf.py
+"""
+import os
+
+# Server socket
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Worker processes (uvicorn[standard] picks uvloop + httptools automatically).
+# Defaults to one: pipeline run status and websocket connections live in
+# process memory, so with more workers a request routed to another process
+# would report an active run as completed and miss its progress updates.
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+# Timeouts
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+# Logging
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("LOG_LEVEL", "info")
@@ -5,6 +5,7 @@ Provides singleton instances of services and storage.
 from functools import lru_cache
 from typing import Dict
 from src.core.rdap_client import RDAPClient
+from src.core.rdap_cache import get_rdap_cache
 from src.core.txt_verification import TXTVerificationManager
 from config.settings import settings
 
@@ -21,7 +22,11 @@ def get_rdap_client() -> RDAPClient:
     Returns:
         Singleton RDAPClient instance
     """
-    return RDAPClient(api_ninjas_key=settings.api_ninjas_key)
+    return RDAPClient(
+        api_ninjas_key=settings.api_ninjas_key,
+        cache=get_rdap_cache(),
+        timeout=settings.rdap_timeout
+    )
 
 
 @lru_cache()
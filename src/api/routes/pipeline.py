@@ -7,18 +7,18 @@ import asyncio
 import os
 import csv
 import json
+import mimetypes
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, BackgroundTasks, UploadFile, File, WebSocket, WebSocketDisconnect
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, UploadFile, File, WebSocket, WebSocketDisconnect
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel
 import httpx
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-from complete_domain_pipeline import CompleteDomainPipeline
 from config.settings import settings
 
 router = APIRouter(prefix="/api/pipeline", tags=["pipeline"])
@@ -99,57 +99,69 @@ external_api_config = ExternalAPIConfig(
 )
 
 
-async def send_to_external_apis(run_id: str, csv_path: Path):
-    """Send results to external APIs (momen and frontend)."""
-    try:
-        # Read CSV content
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            csv_content = f.read()
+def _read_csv_rows(csv_path: Path) -> List[Dict[str, str]]:
+    """Read a CSV file into a list of row dicts in one pass.
+    
+    Args:
+        csv_path: Path to the CSV file
         
-        # Parse CSV to JSON
-        csv_reader = csv.DictReader(csv_content.splitlines())
-        results_json = list(csv_reader)
+    Returns:
+        Rows keyed by header
+    """
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        return list(csv.DictReader(f))
+
+
+async def send_to_external_apis(run_id: str, csv_path: Path, client: httpx.AsyncClient):
+    """Send results to external APIs (momen and frontend).
+    
+    Args:
+        run_id: Pipeline run ID
+        csv_path: Path to the combined results CSV
+        client: Shared HTTP client owned by the application lifespan
+    """
+    try:
+        # Parse CSV rows straight from the file, off the event loop
+        results_json = await asyncio.to_thread(_read_csv_rows, csv_path)
         
         # Send to Momen API (if configured)
         if external_api_config.momen_api_url:
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    headers = {}
-                    if external_api_config.momen_api_key:
-                        headers["Authorization"] = f"Bearer {external_api_config.momen_api_key}"
-                    
-                    response = await client.post(
-                        external_api_config.momen_api_url,
-                        json={
-                            "run_id": run_id,
-                            "results": results_json,
-                            "timestamp": datetime.now(timezone.utc).isoformat()
-                        },
-                        headers=headers
-                    )
-                    print(f"✅ Sent results to Momen API: {response.status_code}")
+                headers = {}
+                if external_api_config.momen_api_key:
+                    headers["Authorization"] = f"Bearer {external_api_config.momen_api_key}"
+                
+                response = await client.post(
+                    external_api_config.momen_api_url,
+                    json={
+                        "run_id": run_id,
+                        "results": results_json,
+                        "timestamp": datetime.now(timezone.utc).isoformat()
+                    },
+                    headers=headers
+                )
+                print(f"✅ Sent results to Momen API: {response.status_code}")
             except Exception as e:
                 print(f"⚠️  Failed to send to Momen API: {str(e)}")
         
         # Send to Frontend API (if configured)
         if external_api_config.frontend_api_url:
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    headers = {}
-                    if external_api_config.frontend_api_key:
-                        headers["Authorization"] = f"Bearer {external_api_config.frontend_api_key}"
-                    
-                    response = await client.post(
-                        external_api_config.frontend_api_url,
-                        json={
-                            "run_id": run_id,
-                            "results": results_json,
-                            "csv_url": f"/api/pipeline/{run_id}/csv",
-                            "timestamp": datetime.now(timezone.utc).isoformat()
-                        },
-                        headers=headers
-                    )
-                    print(f"✅ Sent results to Frontend API: {response.status_code}")
+                headers = {}
+                if external_api_config.frontend_api_key:
+                    headers["Authorization"] = f"Bearer {external_api_config.frontend_api_key}"
+                
+                response = await client.post(
+                    external_api_config.frontend_api_url,
+                    json={
+                        "run_id": run_id,
+                        "results": results_json,
+                        "csv_url": f"/api/pipeline/{run_id}/csv",
+                        "timestamp": datetime.now(timezone.utc).isoformat()
+                    },
+                    headers=headers
+                )
+                print(f"✅ Sent results to Frontend API: {response.status_code}")
             except Exception as e:
                 print(f"⚠️  Failed to send to Frontend API: {str(e)}")
                 
@@ -163,10 +175,14 @@ async def run_pipeline_task(
     enable_txt: bool,
     txt_wait: int,
     txt_attempts: int,
-    txt_interval: int
+    txt_interval: int,
+    http_client: httpx.AsyncClient
 ):
     """Background task to run the pipeline with progress updates."""
     try:
+        # Imported here so the Playwright/pipeline stack is only loaded once a run starts
+        from complete_domain_pipeline import CompleteDomainPipeline
+        
         # Initialize status
         pipeline_status[run_id] = {
             "status": "running",
@@ -205,13 +221,19 @@ async def run_pipeline_task(
             "progress": 10
         })
         
-        await pipeline.run_complete_pipeline(
-            input_csv=str(temp_csv),
-            enable_txt_verification=enable_txt,
-            txt_wait_time=txt_wait,
-            txt_max_attempts=txt_attempts,
-            txt_poll_interval=txt_interval
-        )
+        try:
+            await pipeline.run_complete_pipeline(
+                input_csv=str(temp_csv),
+                enable_txt_verification=enable_txt,
+                txt_wait_time=txt_wait,
+                txt_max_attempts=txt_attempts,
+                txt_poll_interval=txt_interval
+            )
+        finally:
+            # The shared DeepSeek client stays open; the app lifespan closes it
+            await pipeline.close_browser()
+            await pipeline.rdap_client.aclose()
+            pipeline.txt_manager.db.close()
         
         # Clean up temp file
         temp_csv.unlink(missing_ok=True)
@@ -237,7 +259,7 @@ async def run_pipeline_task(
         # Send results to external APIs
         csv_path = Path(f"data/run_{run_id}/results/all_results_{run_id}.csv")
         if csv_path.exists():
-            await send_to_external_apis(run_id, csv_path)
+            await send_to_external_apis(run_id, csv_path, http_client)
         
     except Exception as e:
         error_msg = str(e)
@@ -257,7 +279,7 @@ async def run_pipeline_task(
 
 
 @router.post("/run", response_model=PipelineRunResponse)
-async def run_pipeline(request: PipelineRunRequest, background_tasks: BackgroundTasks):
+async def run_pipeline(request: PipelineRunRequest, background_tasks: BackgroundTasks, http_request: Request):
     """
     Run the complete domain verification pipeline.
     
@@ -270,6 +292,7 @@ async def run_pipeline(request: PipelineRunRequest, background_tasks: Background
     Args:
         request: Pipeline run configuration
         background_tasks: FastAPI background tasks
+        http_request: Incoming HTTP request (for app-level shared state)
         
     Returns:
         Pipeline run response with run_id
@@ -288,7 +311,8 @@ async def run_pipeline(request: PipelineRunRequest, background_tasks: Background
         request.enable_txt_verification,
         request.txt_wait_time,
         request.txt_max_attempts,
-        request.txt_poll_interval
+        request.txt_poll_interval,
+        http_request.app.state.http
     )
     
     return PipelineRunResponse(
@@ -304,6 +328,7 @@ async def run_pipeline(request: PipelineRunRequest, background_tasks: Background
 
 @router.post("/upload", response_model=PipelineRunResponse)
 async def upload_and_run_pipeline(
+    http_request: Request,
     file: UploadFile = File(...),
     enable_txt_verification: bool = False,
     background_tasks: BackgroundTasks = None
@@ -315,6 +340,7 @@ async def upload_and_run_pipeline(
     Supported formats: CSV, XLSX, XLS
     
     Args:
+        http_request: Incoming HTTP request (for app-level shared state)
         file: Uploaded CSV or Excel file
         enable_txt_verification: Enable TXT verification (Stage 4)
         background_tasks: FastAPI background tasks
@@ -415,7 +441,8 @@ async def upload_and_run_pipeline(
             enable_txt_verification,
             30,  # txt_wait_time
             10,  # txt_max_attempts
-            30   # txt_poll_interval
+            30,  # txt_poll_interval
+            http_request.app.state.http
         )
         
         # Clean up temp upload files
@@ -611,7 +638,7 @@ async def get_results_json(run_id: str):
                 row['nameservers'] = []
             results.append(row)
     
-    return JSONResponse(content=results)
+    return ORJSONResponse(content=results)
 
 
 @router.get("/{run_id}/screenshots/{filename}")
@@ -631,9 +658,12 @@ async def download_screenshot(run_id: str, filename: str):
     if not screenshot_file.exists():
         raise HTTPException(status_code=404, detail="Screenshot not found")
     
+    # Newer runs store JPEG screenshots, older ones PNG
+    media_type = mimetypes.guess_type(screenshot_file.name)[0] or "application/octet-stream"
+    
     return FileResponse(
         path=str(screenshot_file),
-        media_type="image/png"
+        media_type=media_type
     )
 
 
@@ -663,7 +693,7 @@ async def configure_external_apis(config: ExternalAPIConfig):
     if config.frontend_api_key:
         external_api_config.frontend_api_key = config.frontend_api_key
     
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "message": "External API configuration updated",
             "momen_configured": bool(external_api_config.momen_api_url),
@@ -680,7 +710,7 @@ async def get_external_api_config():
     Returns:
         Current configuration status
     """
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "momen_api_url": external_api_config.momen_api_url,
             "frontend_api_url": external_api_config.frontend_api_url,
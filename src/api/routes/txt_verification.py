@@ -60,25 +60,25 @@ async def get_run_txt_tasks(
     Returns:
         List of TXT verification tasks
     """
-    tasks = txt_manager.get_tasks_by_case(run_id)
+    tasks = [
+        {
+            "task_id": task['id'],
+            "domain": task['domain'],
+            "status": task['status'],
+            "expected_token": task['expected_token'],
+            "txt_name": task['txt_name'],
+            "attempts": task['attempts'],
+            "max_attempts": task['max_attempts'],
+            "created_at": task['created_at'],
+            "verified_at": task.get('verified_at'),
+            "fail_reason": task.get('fail_reason')
+        }
+        for task in txt_manager.get_task_summaries_by_case(run_id)
+    ]
     
     return {
         "run_id": run_id,
         "tasks_count": len(tasks),
-        "tasks": [
-            {
-                "task_id": task['id'],
-                "domain": task['domain'],
-                "status": task['status'],
-                "expected_token": task['expected_token'],
-                "txt_name": task['txt_name'],
-                "attempts": task['attempts'],
-                "max_attempts": task['max_attempts'],
-                "created_at": task['created_at'],
-                "verified_at": task.get('verified_at'),
-                "fail_reason": task.get('fail_reason')
-            }
-            for task in tasks
-        ]
+        "tasks": tasks
     }
 
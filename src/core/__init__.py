@@ -1,11 +1,19 @@
 """Core business logic for the application."""
 from .rdap_client import RDAPClient
+from .rdap_cache import RDAPResponseCache
+from .deepseek_client import DeepSeekClient
+from .llm_cache import LLMResponseCache
 from .legal_intel import LegalIntelligence
 from .txt_verification import TXTVerificationManager
+from .txt_checker import TXTRecordChecker
 
 __all__ = [
     "RDAPClient",
+    "RDAPResponseCache",
+    "DeepSeekClient",
+    "LLMResponseCache",
     "LegalIntelligence",
-    "TXTVerificationManager"
+    "TXTVerificationManager",
+    "TXTRecordChecker"
 ]
 
@@ -0,0 +1,224 @@
+"""
+DeepSeek chat completion client.
+Keeps a single pooled HTTP/2 httpx.AsyncClient so repeated LLM calls
+multiplex over the same TCP/TLS connection instead of handshaking on every
+request.
+"""
+import asyncio
+import hashlib
+import json
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import httpx
+
+from config.settings import settings, DEEPSEEK_FALLBACK_KEY
+from .llm_cache import LLMResponseCache
+
+
+class DeepSeekClient:
+    """Client for the DeepSeek chat completions API."""
+
+    BASE_URL = "https://api.deepseek.com/"
+    API_URL = "https://api.deepseek.com/v1/chat/completions"
+
+    def __init__(self, api_key: str, timeout: float = 60.0,
+                 max_keepalive: int = 20, max_connections: int = 100,
+                 cache: Optional[LLMResponseCache] = None):
+        """Initialize DeepSeek client.
+
+        Args:
+            api_key: DeepSeek API key
+            timeout: Request timeout in seconds
+            max_keepalive: Idle connections kept open for reuse (0 disables reuse)
+            max_connections: Upper bound on concurrent connections
+            cache: Optional response cache; successful completions are stored in it
+        """
+        self.api_key = api_key
+        self.timeout = httpx.Timeout(timeout)
+        self.limits = httpx.Limits(
+            max_keepalive_connections=max_keepalive,
+            max_connections=max_connections,
+            keepalive_expiry=30
+        )
+        self.cache = cache
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop.
+
+        httpx connections are bound to the loop that opened them, so a new
+        client is created if we are called from a different loop.
+
+        Returns:
+            Shared httpx.AsyncClient instance
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._discard_client()
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=self.limits,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                }
+            )
+            self._loop = loop
+        return self._client
+
+    def _discard_client(self):
+        """Close the client opened on a previous event loop.
+
+        httpx clients can only be closed on the loop that owns their
+        connections, so the close is scheduled there while that loop is still
+        open. Once a loop is closed its transports are unusable and are
+        released when the dropped client is garbage collected.
+        """
+        if self._client is not None and self._loop is not None and not self._loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop)
+        self._client = None
+        self._loop = None
+
+    async def warmup(self):
+        """Open a pooled connection before the first completion request.
+
+        DNS resolution and the TLS handshake then happen off the request path.
+        Errors are ignored; chat_completion() connects again if needed.
+        """
+        try:
+            await self._get_client().head(self.BASE_URL)
+        except httpx.HTTPError:
+            pass
+
+    async def chat_completion(self, messages: List[Dict],
+                              model: str = "deepseek-chat",
+                              cache_key: Optional[str] = None, use_cache: bool = True,
+                              **options) -> Dict:
+        """Send a chat completion request, serving repeats from the cache.
+
+        Identical requests already in flight are coalesced onto one API call.
+
+        Args:
+            messages: Chat messages
+            model: Model name
+            cache_key: Explicit cache identity for prompts that embed volatile
+                values (timestamps); defaults to a hash of model, messages and options
+            use_cache: Set to False to neither read nor store the response in the cache
+            **options: Extra request fields (temperature, max_tokens, ...)
+
+        Returns:
+            Decoded JSON response body
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status
+        """
+        store = use_cache and self.cache is not None
+        if store:
+            key = self.cache.make_key(model, cache_key or messages, options)
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+        else:
+            key = hashlib.sha256(
+                json.dumps([model, cache_key or messages, options], sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest()
+
+        # Single-flight: concurrent callers with the same key share one request
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, messages, model, options, store))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def get_cached(self, cache_key: str, model: str = "deepseek-chat", **options) -> Optional[Dict]:
+        """Look up a cached response without calling the API.
+
+        Args:
+            cache_key: Cache identity passed to chat_completion()
+            model: Model name
+            **options: Extra request fields used for the original request
+
+        Returns:
+            Cached response body or None
+        """
+        if self.cache is None:
+            return None
+        return await self.cache.get(self.cache.make_key(model, cache_key, options))
+
+    async def store_cached(self, cache_key: str, data: Dict, model: str = "deepseek-chat", **options):
+        """Store a response under a cache identity without calling the API.
+
+        Args:
+            cache_key: Cache identity later passed to chat_completion()
+            data: Response body in chat completion format
+            model: Model name
+            **options: Extra request fields of the matching request
+        """
+        if self.cache is not None:
+            await self.cache.set(self.cache.make_key(model, cache_key, options), data)
+
+    async def _fetch(self, key: str, messages: List[Dict], model: str, options: Dict,
+                     store: bool) -> Dict:
+        """Post a completion request and optionally store the response in the cache.
+
+        Args:
+            key: Request key
+            messages: Chat messages
+            model: Model name
+            options: Extra request fields
+            store: Whether to cache the response under key
+
+        Returns:
+            Decoded JSON response body
+        """
+        response = await self._get_client().post(
+            self.API_URL,
+            json={"model": model, "messages": messages, **options}
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        if store:
+            await self.cache.set(key, data)
+        return data
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+
+@lru_cache()
+def get_deepseek_client() -> DeepSeekClient:
+    """
+    Get or create the shared DeepSeek client.
+
+    Returns:
+        Singleton DeepSeekClient instance
+    """
+    cache = None
+    if settings.llm_cache_enabled:
+        cache = LLMResponseCache(
+            cache_dir=settings.llm_cache_dir,
+            ttl=settings.llm_cache_ttl,
+            maxsize=settings.llm_cache_maxsize,
+            version=settings.llm_cache_version,
+            disk_ttl=settings.llm_cache_disk_ttl
+        )
+
+    return DeepSeekClient(
+        api_key=settings.deepseek_api_key or DEEPSEEK_FALLBACK_KEY,
+        timeout=settings.deepseek_timeout,
+        max_keepalive=settings.deepseek_httpx_keepalive,
+        max_connections=settings.deepseek_httpx_max_connections,
+        cache=cache
+    )
@@ -6,6 +6,18 @@ from typing import List, Tuple
 from dateutil.relativedelta import relativedelta
 import re
 
+# Compiled once; these run for every registrant assessed
+_RE_NAME_PUNCTUATION = re.compile(r'[.,\-_()]+')
+_RE_NON_NAME_CHARS = re.compile(r'[0-9@#$%&*]')
+
+# Common company suffixes
+_COMPANY_INDICATORS = (
+    'inc', 'llc', 'ltd', 'corp', 'corporation', 'company',
+    'gmbh', 'b.v.', 'bv', 'n.v.', 'nv', 'sa', 's.a.',
+    'limited', 'holdings', 'group', 'enterprises', 'solutions',
+    'technologies', 'services', 'international'
+)
+
 
 class LegalIntelligence:
     """Classifier for legal risk and ownership assessment."""
@@ -28,7 +40,7 @@ class LegalIntelligence:
         if not name:
             return ''
         # Remove common punctuation and normalize spaces
-        normalized = re.sub(r'[.,\-_()]+', ' ', name.lower())
+        normalized = _RE_NAME_PUNCTUATION.sub(' ', name.lower())
         normalized = ' '.join(normalized.split())
         return normalized
     
@@ -46,24 +58,15 @@ class LegalIntelligence:
         
         name_lower = name.lower()
         
-        # Common company suffixes
-        company_indicators = [
-            'inc', 'llc', 'ltd', 'corp', 'corporation', 'company',
-            'gmbh', 'b.v.', 'bv', 'n.v.', 'nv', 'sa', 's.a.',
-            'limited', 'holdings', 'group', 'enterprises', 'solutions',
-            'technologies', 'services', 'international'
-        ]
-        
-        for indicator in company_indicators:
-            if indicator in name_lower:
-                return False
+        if any(indicator in name_lower for indicator in _COMPANY_INDICATORS):
+            return False
         
         # Check if it looks like a person name (2-4 words, no special chars)
         words = name.split()
         if 2 <= len(words) <= 4:
             # If all words start with capital letter and no numbers/special chars
             if all(word[0].isupper() for word in words if word):
-                if not re.search(r'[0-9@#$%&*]', name):
+                if not _RE_NON_NAME_CHARS.search(name):
                     return True
         
         return False
@@ -0,0 +1,131 @@
+"""
+Two-tier response cache for LLM chat completions.
+Recent responses are kept in an in-memory LRU with a TTL; every response is
+also written to disk so pipeline re-runs over the same pages skip the API.
+Disk entries expire by file age and are pruned when the cache is created.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """In-memory LRU/TTL cache backed by one JSON file per entry."""
+
+    def __init__(self, cache_dir: str, ttl: float = 3600, maxsize: int = 1024,
+                 version: str = "1", disk_ttl: float = 604800):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the on-disk tier
+            ttl: Seconds an entry stays in the in-memory tier
+            maxsize: Maximum number of in-memory entries
+            version: Cache version; bump it when prompts change to invalidate old entries
+            disk_ttl: Seconds an entry stays in the on-disk tier
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.version = version
+        self.disk_ttl = disk_ttl
+        self._memory: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self.prune()
+
+    def prune(self):
+        """Delete on-disk entries older than disk_ttl."""
+        cutoff = time.time() - self.disk_ttl
+        try:
+            entries = list(self.cache_dir.glob("*.json"))
+        except OSError:
+            return
+        for path in entries:
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass  # Removed concurrently or unreadable; try again next time
+
+    def make_key(self, *parts) -> str:
+        """Build a stable cache key from JSON-serializable parts.
+
+        Args:
+            *parts: Values that identify the request (model, messages, options, ...)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps([self.version, *parts], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict]:
+        """Look up a cached response.
+
+        The disk tier is read in a worker thread so it does not block the event loop.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached response body or None on miss
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._memory.move_to_end(key)
+                return value
+            del self._memory[key]
+
+        value = await asyncio.to_thread(self._read, key)
+        if value is not None:
+            self._remember(key, value)
+        return value
+
+    def _read(self, key: str) -> Optional[Dict]:
+        """Read an entry from the on-disk tier, deleting it if it has expired."""
+        # Disk entries are keyed on the full request content, so they stay valid
+        # until the cache version changes or they reach disk_ttl
+        path = self.cache_dir / f"{key}.json"
+        try:
+            if path.stat().st_mtime < time.time() - self.disk_ttl:
+                path.unlink(missing_ok=True)
+                return None
+            return orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    async def set(self, key: str, value: Dict):
+        """Store a response in both tiers.
+
+        The disk write runs in a worker thread so it does not block the event loop.
+
+        Args:
+            key: Cache key from make_key()
+            value: Response body to cache
+        """
+        self._remember(key, value)
+        await asyncio.to_thread(self._write, key, orjson.dumps(value))
+
+    def _write(self, key: str, data: bytes):
+        """Write an encoded entry to the on-disk tier."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            (self.cache_dir / f"{key}.json").write_bytes(data)
+        except OSError as e:
+            logger.warning(f"⚠️  LLM cache write failed: {e}")
+
+    def _remember(self, key: str, value: Dict):
+        """Insert into the in-memory tier, evicting the least recently used entry."""
+        self._memory[key] = (time.monotonic() + self.ttl, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
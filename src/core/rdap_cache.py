@@ -0,0 +1,117 @@
+"""
+Persistent cache for RDAP and WHOIS responses.
+Registration data rarely changes between runs, so raw responses are kept in
+a small SQLite file and re-parsed on a hit; re-running the pipeline over the
+same domains then skips the registries almost entirely. Definitive "not
+found" answers are cached for a shorter time; transient failures are not
+cached at all.
+"""
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import orjson
+
+from config.settings import settings
+
+
+class RDAPResponseCache:
+    """Domain -> raw lookup response cache with per-entry expiry."""
+
+    def __init__(self, db_path: str, ttl: float = 86400, negative_ttl: float = 3600):
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite file for the cache
+            ttl: Seconds a successful response stays valid
+            negative_ttl: Seconds a "not found" lookup stays cached (0 disables negative caching)
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS rdap_cache (
+                domain TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                source_url TEXT NOT NULL,
+                payload TEXT,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, domain: str) -> Optional[Tuple[str, str, Optional[Dict]]]:
+        """Look up a cached response.
+
+        Args:
+            domain: Domain name
+
+        Returns:
+            Tuple of (kind, source_url, payload) or None on miss; kind is
+            'rdap', 'whois' or 'failed' (payload is None for failures)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT kind, source_url, payload, expires_at FROM rdap_cache WHERE domain = ?",
+                (domain,)
+            ).fetchone()
+
+        if row is None or row[3] <= time.time():
+            return None
+        kind, source_url, payload, _ = row
+        return kind, source_url, orjson.loads(payload) if payload is not None else None
+
+    def set(self, domain: str, kind: str, source_url: str, payload: Optional[Dict]):
+        """Store a lookup response.
+
+        Args:
+            domain: Domain name
+            kind: 'rdap', 'whois' or 'failed'
+            source_url: URL the response came from ('' for failures)
+            payload: Decoded JSON response body (None for failures)
+        """
+        ttl = self.negative_ttl if kind == 'failed' else self.ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO rdap_cache (domain, kind, source_url, payload, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (domain, kind, source_url,
+                 orjson.dumps(payload) if payload is not None else None,
+                 time.time() + ttl)
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@lru_cache()
+def get_rdap_cache() -> Optional[RDAPResponseCache]:
+    """
+    Get or create the shared RDAP response cache.
+
+    Returns:
+        Singleton RDAPResponseCache instance, or None if caching is disabled
+    """
+    if not settings.rdap_cache_enabled:
+        return None
+
+    return RDAPResponseCache(
+        db_path=settings.rdap_cache_path,
+        ttl=settings.rdap_cache_ttl,
+        negative_ttl=settings.rdap_cache_negative_ttl
+    )
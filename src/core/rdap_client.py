@@ -1,11 +1,19 @@
 """
 RDAP and WHOIS client for domain lookups.
+All lookups share one pooled HTTP/2 client, so repeated queries to the same
+registry reuse its connection instead of handshaking per domain.
 """
+import asyncio
+import time
 import httpx
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional, Dict, List, Tuple
+from urllib.parse import urlsplit
 import re
 
+from .rdap_cache import RDAPResponseCache
+
 
 class RDAPClient:
     """Client for RDAP and WHOIS lookups."""
@@ -21,14 +29,136 @@ class RDAPClient:
     # Fallback WHOIS API
     WHOIS_API = "https://api.api-ninjas.com/v1/whois?domain={}"
     
-    def __init__(self, api_ninjas_key: Optional[str] = None):
+    # Retry policy for HTTP 429 responses
+    MAX_RATE_LIMIT_RETRIES = 3
+    MAX_RETRY_AFTER = 60.0
+    
+    def __init__(self, api_ninjas_key: Optional[str] = None, host_interval: float = 0.2,
+                 host_concurrency: int = 4, cache: Optional[RDAPResponseCache] = None,
+                 timeout: float = 30.0):
         """Initialize RDAP client.
         
         Args:
             api_ninjas_key: Optional API key for API Ninjas WHOIS fallback
+            host_interval: Minimum seconds between requests to the same host
+            host_concurrency: Maximum requests in flight to the same host
+            cache: Optional persistent response cache consulted before the network
+            timeout: Request timeout in seconds
         """
         self.api_ninjas_key = api_ninjas_key
-        self.timeout = httpx.Timeout(30.0)
+        self.cache = cache
+        self.timeout = httpx.Timeout(timeout)
+        self.limits = httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=30)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.host_interval = host_interval
+        self.host_concurrency = host_concurrency
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._host_last_request: Dict[str, float] = {}
+    
+    async def _throttle(self, url: str):
+        """Wait until the next request to this URL's host is allowed.
+        
+        Requests to different hosts never wait on each other, so concurrent
+        lookups across registries run in parallel.
+        
+        Args:
+            url: Request URL
+        """
+        host = urlsplit(url).hostname or ''
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            wait = self._host_last_request.get(host, 0.0) + self.host_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._host_last_request[host] = time.monotonic()
+    
+    def _parse_retry_after(self, value: Optional[str]) -> float:
+        """Parse a Retry-After header (delay in seconds or an HTTP date).
+        
+        Args:
+            value: Header value
+            
+        Returns:
+            Seconds to wait, capped at MAX_RETRY_AFTER
+        """
+        if not value:
+            return self.MAX_RETRY_AFTER
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = self.MAX_RETRY_AFTER
+        return min(max(delay, 0.0), self.MAX_RETRY_AFTER)
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client for the running event loop.
+        
+        httpx connections are bound to the loop that opened them, so a new
+        client is created if we are called from a different loop.
+        
+        Returns:
+            Shared httpx.AsyncClient instance
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._discard_client()
+            self._client = httpx.AsyncClient(http2=True, timeout=self.timeout, limits=self.limits)
+            self._loop = loop
+        return self._client
+    
+    def _discard_client(self):
+        """Close the client opened on a previous event loop.
+        
+        httpx clients can only be closed on the loop that owns their
+        connections, so the close is scheduled there while that loop is still
+        open. Once a loop is closed its transports are unusable and are
+        released when the dropped client is garbage collected.
+        """
+        if self._client is not None and self._loop is not None and not self._loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop)
+        self._client = None
+        self._loop = None
+    
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+    
+    async def _get(self, url: str, headers: Optional[Dict] = None) -> httpx.Response:
+        """GET a URL with per-host pacing and concurrency, backing off only when rate limited.
+        
+        On HTTP 429 the host is paused for the server's Retry-After delay, so
+        concurrent lookups against the same registry wait as well.
+        
+        Args:
+            url: Request URL
+            headers: Optional request headers
+            
+        Returns:
+            Final response (raise_for_status has been called)
+        """
+        host = urlsplit(url).hostname or ''
+        # Each registry gets its own cap, so a slow one cannot use up every slot
+        slots = self._host_slots.setdefault(host, asyncio.Semaphore(self.host_concurrency))
+        client = self._get_client()
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            await self._throttle(url)
+            async with slots:
+                response = await client.get(url, headers=headers)
+            if response.status_code != 429 or attempt == self.MAX_RATE_LIMIT_RETRIES:
+                break
+            
+            delay = self._parse_retry_after(response.headers.get('Retry-After'))
+            self._host_last_request[host] = time.monotonic() + delay - self.host_interval
+        
+        response.raise_for_status()
+        return response
     
     def get_tld(self, domain: str) -> str:
         """Extract TLD from domain."""
@@ -206,40 +336,70 @@ class RDAPClient:
         Returns:
             Tuple of (parsed_data, source_url)
         """
+        if self.cache is not None:
+            cached = self.cache.get(domain)
+            if cached is not None:
+                kind, source_url, payload = cached
+                if kind == 'rdap':
+                    return self.parse_rdap_response(payload, source_url), source_url
+                if kind == 'whois':
+                    return self.parse_whois_response(payload), source_url
+                return self._failed_result(), ''
+        
         tld = self.get_tld(domain)
+        # A failure is only cached when every source answered "not found";
+        # timeouts, 5xx and exhausted 429 retries are retried on the next lookup
+        attempted = False
+        not_found = True
         
         # Try RDAP first
         if tld in self.RDAP_ENDPOINTS:
             rdap_url = self.RDAP_ENDPOINTS[tld].format(domain)
             
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(rdap_url)
-                    response.raise_for_status()
-                    rdap_data = response.json()
-                    
-                    parsed = self.parse_rdap_response(rdap_data, rdap_url)
-                    return parsed, rdap_url
+                response = await self._get(rdap_url)
+                rdap_data = response.json()
+                
+                parsed = self.parse_rdap_response(rdap_data, rdap_url)
+                if self.cache is not None:
+                    self.cache.set(domain, 'rdap', rdap_url, rdap_data)
+                return parsed, rdap_url
             except Exception as e:
                 print(f"RDAP lookup failed for {domain}: {e}")
+                attempted = True
+                not_found = not_found and self._is_not_found(e)
         
         # Fallback to WHOIS API
         if self.api_ninjas_key:
             whois_url = self.WHOIS_API.format(domain)
             
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    headers = {'X-Api-Key': self.api_ninjas_key}
-                    response = await client.get(whois_url, headers=headers)
-                    response.raise_for_status()
-                    whois_data = response.json()
-                    
-                    parsed = self.parse_whois_response(whois_data)
-                    return parsed, whois_url
+                headers = {'X-Api-Key': self.api_ninjas_key}
+                response = await self._get(whois_url, headers=headers)
+                whois_data = response.json()
+                
+                parsed = self.parse_whois_response(whois_data)
+                if self.cache is not None:
+                    self.cache.set(domain, 'whois', whois_url, whois_data)
+                return parsed, whois_url
             except Exception as e:
                 print(f"WHOIS API lookup failed for {domain}: {e}")
+                attempted = True
+                not_found = not_found and self._is_not_found(e)
         
         # Return empty result if all lookups fail
+        if self.cache is not None and attempted and not_found:
+            self.cache.set(domain, 'failed', '', None)
+        return self._failed_result(), ''
+    
+    @staticmethod
+    def _is_not_found(error: Exception) -> bool:
+        """Check whether a lookup error is a definitive "not found" answer."""
+        return isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 404
+    
+    @staticmethod
+    def _failed_result() -> Dict:
+        """Build the empty lookup result returned when every source fails."""
         return {
             'registrar': None,
             'registry': None,
@@ -250,6 +410,5 @@ class RDAPClient:
             'registrant_name_raw': None,
             'raw_status': [],
             'data_source': None,
-            'data_source_type': 'failed',
-            'registry': None
-        }, ''
+            'data_source_type': 'failed'
+        }
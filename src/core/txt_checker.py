@@ -0,0 +1,384 @@
+"""
+DNS TXT record checker for TXT verification.
+Resolves TXT records with dnspython's async resolver when available and falls
+back to the dig command otherwise. Answers are cached for their DNS TTL (or
+the SOA minimum for negative answers), so polling faster than the records
+can change skips the network. With hedging enabled every nameserver is
+queried in parallel and the first one that sees the token wins.
+"""
+import asyncio
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+    import dns.rdatatype
+    import dns.resolver
+except ImportError:  # dnspython is optional; fall back to dig
+    dns = None
+
+# One quoted character-string in a line of `dig +short TXT` output
+_DIG_TXT_STRING = re.compile(rb'"((?:[^"\\]|\\.)*)"')
+
+
+class TXTRecordChecker:
+    """Checks whether a domain publishes an expected TXT token."""
+
+    # When no hedged resolver sees the token, report the most informative failure
+    _FAILURE_RANK = {"TOKEN_NOT_FOUND": 0, "NO_ANSWER": 1, "TIMEOUT": 2}
+
+    def __init__(self, nameservers: Sequence[str] = ("1.1.1.1", "8.8.8.8", "9.9.9.9"),
+                 lifetime: float = 5.0, max_cache_ttl: float = 300, hedge: bool = True):
+        """Initialize TXT checker.
+
+        Args:
+            nameservers: Default resolver IPs to query
+            lifetime: Per-query time budget in seconds
+            max_cache_ttl: Upper bound in seconds on how long an answer is cached (0 disables caching)
+            hedge: Query every nameserver in parallel instead of one resolver with failover
+        """
+        self.nameservers = tuple(nameservers)
+        self.lifetime = lifetime
+        self.max_cache_ttl = max_cache_ttl
+        self.hedge = hedge
+        self._resolvers: Dict[Tuple[str, ...], "dns.asyncresolver.Resolver"] = {}
+        if dns is not None:
+            # Default-nameserver queries share these resolvers
+            if hedge:
+                for ns in self.nameservers:
+                    self._get_resolver((ns,))
+            else:
+                self._get_resolver(self.nameservers)
+        # (nameservers, domain) -> (expires_at, TXT records or None for a negative answer)
+        self._cache: Dict[Tuple[Tuple[str, ...], str], Tuple[float, Optional[List[Tuple[str, str]]]]] = {}
+        self._inflight: Dict[Tuple[Tuple[str, ...], str], asyncio.Future] = {}
+
+    async def is_reachable(self, timeout: float = 1.0) -> bool:
+        """Quickly check whether DNS resolution works at all.
+
+        Lets callers skip DNS-dependent work when offline instead of waiting
+        out the full lookup timeout for every domain.
+
+        Args:
+            timeout: Time budget in seconds for the probe
+
+        Returns:
+            True if any default nameserver (or, without dnspython, the system
+            resolver) answered within the timeout
+        """
+        if dns is None:
+            try:
+                await asyncio.wait_for(asyncio.get_running_loop().getaddrinfo("one.one.one.one", 53), timeout)
+                return True
+            except (OSError, asyncio.TimeoutError):
+                return False
+
+        async def probe(resolver) -> bool:
+            try:
+                await resolver.resolve(".", "NS", lifetime=timeout)
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                pass  # A negative answer still means the resolver is reachable
+            except Exception:
+                return False
+            return True
+
+        return any(await asyncio.gather(*(probe(r) for r in self._resolvers.values())))
+
+    async def prefetch(self, domains: Sequence[str], lifetime: float = 2.0, concurrency: int = 50):
+        """Warm the upstream resolvers' caches for the domains' delegations.
+
+        Only NS records are requested. Querying TXT ahead of time would leave
+        negative answers cached upstream (and here) for the SOA minimum TTL,
+        hiding records the user is about to add. Warming the delegation chain
+        still reduces the first real TXT query to one authoritative hop.
+
+        Args:
+            domains: Domains about to be checked
+            lifetime: Per-query time budget in seconds
+            concurrency: Maximum queries in flight
+        """
+        if dns is None:
+            return
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def warm(resolver, domain: str):
+            async with semaphore:
+                try:
+                    await resolver.resolve(domain, "NS", lifetime=lifetime)
+                except Exception:
+                    pass  # Results are discarded; only the upstream cache matters
+
+        resolvers = list(self._resolvers.values())
+        await asyncio.gather(*(warm(r, d) for r in resolvers for d in domains))
+
+    def seconds_until_fresh(self, domains: Iterable[str]) -> float:
+        """Time until at least one domain's cached answer expires.
+
+        Args:
+            domains: Domains checked against the default nameservers
+
+        Returns:
+            Seconds until a re-check could return new data (0 if one is not cached)
+        """
+        if self.hedge and len(self.nameservers) > 1:
+            server_sets = [(ns,) for ns in self.nameservers]
+        else:
+            server_sets = [self.nameservers]
+
+        now = time.monotonic()
+        soonest = None
+        for domain in domains:
+            domain = domain.lower()
+            for servers in server_sets:
+                cached = self._cache.get((servers, domain))
+                if cached is None or cached[0] <= now:
+                    return 0.0
+                soonest = cached[0] if soonest is None else min(soonest, cached[0])
+        return soonest - now if soonest is not None else 0.0
+
+    def clear_cache(self):
+        """Drop all cached answers."""
+        self._cache.clear()
+
+    def _get_resolver(self, nameservers: Tuple[str, ...]) -> "dns.asyncresolver.Resolver":
+        """Get the resolver for a nameserver set, creating it on first use.
+
+        Args:
+            nameservers: Resolver IPs
+
+        Returns:
+            Cached async resolver
+        """
+        resolver = self._resolvers.get(nameservers)
+        if resolver is None:
+            # configure=False skips reading /etc/resolv.conf; answers are cached
+            # by this class, so dnspython's own cache stays off
+            resolver = dns.asyncresolver.Resolver(configure=False)
+            resolver.nameservers = list(nameservers)
+            resolver.lifetime = self.lifetime
+            self._resolvers[nameservers] = resolver
+        return resolver
+
+    async def check(self, domain: str, expected_token: str,
+                    nameservers: Optional[Sequence[str]] = None) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Check whether the domain's TXT records contain the expected token.
+
+        Args:
+            domain: Domain name to check
+            expected_token: Expected verification token
+            nameservers: Resolver IPs to use instead of the defaults
+
+        Returns:
+            Tuple of (success, dns_raw_output, error_message); the raw output
+            lists one quoted TXT record per line, like `dig +short`
+        """
+        servers = tuple(nameservers) if nameservers else self.nameservers
+        if self.hedge and len(servers) > 1:
+            return await self._check_hedged(domain, expected_token, servers)
+        return await self._check_one(domain, expected_token, servers)
+
+    async def _check_hedged(self, domain: str, expected_token: str,
+                            servers: Tuple[str, ...]) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Race the check across nameservers, returning on the first success.
+
+        A failure is only reported once every nameserver has answered.
+
+        Args:
+            domain: Domain name to check
+            expected_token: Expected verification token
+            servers: Resolver IPs, each queried on its own
+
+        Returns:
+            Tuple of (success, dns_raw_output, error_message)
+        """
+        tasks = [
+            asyncio.ensure_future(self._check_one(domain, expected_token, (ns,)))
+            for ns in servers
+        ]
+        failures = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                if result[0]:
+                    return result
+                failures.append(result)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return min(failures, key=lambda result: self._FAILURE_RANK.get(result[2], len(self._FAILURE_RANK)))
+
+    async def _check_one(self, domain: str, expected_token: str,
+                         servers: Tuple[str, ...]) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Check the token with one resolver (or dig against its first nameserver).
+
+        Args:
+            domain: Domain name to check
+            expected_token: Expected verification token
+            servers: Resolver IPs
+
+        Returns:
+            Tuple of (success, dns_raw_output, error_message)
+        """
+        if dns is None:
+            return await self._check_via_dig(domain, expected_token, servers[0])
+
+        records, error = await self._lookup(servers, domain.lower())
+        if error is not None:
+            return False, "" if error == "NO_ANSWER" else None, error
+
+        output = "\n".join(raw for raw, _ in records)
+        # Fast path: the token shows up verbatim unless a record splits it across strings
+        if expected_token in output:
+            return True, output, None
+        for _, txt_value in records:
+            if expected_token in txt_value:
+                return True, output, None
+
+        return False, output, "TOKEN_NOT_FOUND"
+
+    async def _lookup(self, servers: Tuple[str, ...],
+                      domain: str) -> Tuple[Optional[List[Tuple[str, str]]], Optional[str]]:
+        """Get a name's TXT records from the cache or a shared in-flight query.
+
+        Tasks that verify the same name share one DNS query per attempt.
+
+        Args:
+            servers: Resolver IPs
+            domain: Lowercase domain name
+
+        Returns:
+            Tuple of ((raw, decoded) records, error_message); records is None on error
+        """
+        key = (servers, domain)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            if cached[1] is None:
+                return None, "NO_ANSWER"
+            return cached[1], None
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._resolve(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so a cancelled (hedged) caller does not cancel the query for the others
+        return await asyncio.shield(task)
+
+    async def _resolve(self, key: Tuple[Tuple[str, ...], str]) -> Tuple[Optional[List[Tuple[str, str]]], Optional[str]]:
+        """Query TXT records and cache the answer.
+
+        Args:
+            key: (nameservers, domain) pair
+
+        Returns:
+            Tuple of ((raw, decoded) records, error_message); records is None on error
+        """
+        servers, domain = key
+        try:
+            answer = await self._get_resolver(servers).resolve(domain, "TXT")
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+            self._remember(key, None, self._negative_ttl(e))
+            return None, "NO_ANSWER"
+        except (dns.resolver.NoNameservers, dns.resolver.YXDOMAIN):
+            return None, "NO_ANSWER"
+        except dns.exception.Timeout:
+            return None, "TIMEOUT"
+        except Exception as e:
+            return None, str(e)
+
+        records = [
+            (rdata.to_text(), b"".join(rdata.strings).decode("utf-8", errors="replace"))
+            for rdata in answer
+        ]
+        self._remember(key, records, answer.rrset.ttl)
+        return records, None
+
+    def _remember(self, key: Tuple[Tuple[str, ...], str],
+                  records: Optional[List[Tuple[str, str]]], ttl: Optional[float]):
+        """Cache an answer for its TTL, capped at max_cache_ttl."""
+        ttl = min(ttl or 0, self.max_cache_ttl)
+        if ttl > 0:
+            self._cache[key] = (time.monotonic() + ttl, records)
+
+    @staticmethod
+    def _negative_ttl(error: Exception) -> Optional[float]:
+        """Get the negative-caching TTL (RFC 2308) from the SOA in a negative answer.
+
+        Args:
+            error: NXDOMAIN or NoAnswer raised by the resolver
+
+        Returns:
+            Seconds the negative answer stays valid, or None if no SOA was returned
+        """
+        if isinstance(error, dns.resolver.NXDOMAIN):
+            responses = list(error.responses().values())
+        else:
+            response = error.kwargs.get("response")
+            responses = [response] if response is not None else []
+
+        for response in responses:
+            for rrset in response.authority:
+                if rrset.rdtype == dns.rdatatype.SOA:
+                    return min(rrset.ttl, rrset[0].minimum)
+        return None
+
+    async def _check_via_dig(self, domain: str, expected_token: str,
+                             nameserver: str) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Check TXT record using the dig command.
+
+        Args:
+            domain: Domain name to check
+            expected_token: Expected verification token
+            nameserver: Resolver IP to query
+
+        Returns:
+            Tuple of (success, dns_raw_output, error_message)
+        """
+        # One try bounded by the query lifetime; dig's default of three
+        # 5-second tries could hold a check for 15 seconds on a dead zone
+        dig_time = max(1, round(self.lifetime))
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "dig", f"@{nameserver}", "TXT", domain, "+short", "+tries=1", f"+time={dig_time}",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError:
+            return False, None, "DIG_NOT_INSTALLED"
+        except Exception as e:
+            return False, None, str(e)
+
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=dig_time + 1)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False, None, "TIMEOUT"
+        except asyncio.CancelledError:
+            # Lost a hedged race; don't leave dig running
+            proc.kill()
+            raise
+
+        output = stdout.decode("utf-8", errors="replace").strip()
+
+        # Check if there's any output
+        if not output:
+            return False, output, "NO_ANSWER"
+
+        # dig prints each record as its quoted strings, so a token that was
+        # not split across strings is found by a plain substring search
+        token = expected_token.encode("utf-8")
+        if token in stdout:
+            return True, output, None
+
+        # Otherwise join each record's strings, which dig prints as "a" "b"
+        for line in stdout.splitlines():
+            if token in b"".join(_DIG_TXT_STRING.findall(line)):
+                return True, output, None
+
+        return False, output, "TOKEN_NOT_FOUND"
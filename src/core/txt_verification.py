@@ -5,7 +5,7 @@ Implements active control verification via DNS TXT records.
 import secrets
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from src.database.txt_database import TXTDatabase
 
 
@@ -33,6 +33,14 @@ class TXTVerificationManager:
         """
         self.db = TXTDatabase(db_path)
     
+    def transaction(self):
+        """Batch database writes into a single transaction.
+        
+        Returns:
+            Context manager that commits when the block exits
+        """
+        return self.db.transaction()
+    
     def generate_verification_token(self) -> str:
         """Generate a random verification token.
         
@@ -188,6 +196,22 @@ Status: {task['status']}
                 task_id
             )
     
+    def assess_ownership_bulk(self, cases: Iterable[Dict]) -> List[Tuple[str, str, Optional[str]]]:
+        """Assess several domains, creating any TXT tasks in one transaction.
+        
+        Args:
+            cases: Dicts with 'domain', 'case_id' and 'data' (parsed RDAP/WHOIS data)
+        
+        Returns:
+            List of (ownership_status, ownership_reason, txt_task_id) tuples,
+            in the same order as cases
+        """
+        with self.transaction():
+            return [
+                self.assess_ownership(case['domain'], case['case_id'], case['data'])
+                for case in cases
+            ]
+    
     def get_tasks_by_case(self, case_id: str) -> list:
         """Get all TXT verification tasks for a case.
         
@@ -199,6 +223,17 @@ Status: {task['status']}
         """
         return self.db.get_tasks_by_case(case_id)
     
+    def get_task_summaries_by_case(self, case_id: str) -> List[Dict]:
+        """Get the TXT verification tasks for a case in creation order.
+        
+        Args:
+            case_id: Case/run ID
+            
+        Returns:
+            List of task dictionaries with the user-facing columns only
+        """
+        return self.db.get_task_summaries_by_case(case_id)
+    
     def save_domain_result(self, case_id: str, domain: str, 
                           ownership_status: str, ownership_reason: str,
                           txt_task_id: Optional[str] = None,
@@ -241,3 +276,16 @@ Status: {task['status']}
             ownership_status=ownership_status,
             ownership_reason=ownership_reason
         )
+    
+    def bulk_update_domains_verified(self, verified: Iterable[Tuple[str, datetime]], case_id: str):
+        """Update several domains after TXT verification succeeds.
+        
+        Args:
+            verified: (domain, verified_at) tuples
+            case_id: Case/run ID
+        """
+        self.db.bulk_update_domain_ownership(
+            (domain, case_id, "VERIFIED_BY_TXT",
+             f"Domain control verified via DNS TXT at {verified_at.isoformat()}")
+            for domain, verified_at in verified
+        )
@@ -1,11 +1,12 @@
 """
 Database layer for TXT verification tasks.
-Uses SQLite for persistence.
+Uses SQLite for persistence over a single long-lived WAL-mode connection.
 """
 import sqlite3
 import json
+import threading
 from datetime import datetime, timezone
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Tuple
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -20,17 +21,52 @@ class TXTDatabase:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        # One connection shared by all calls; the lock serializes access from
+        # API worker threads
+        self._lock = threading.RLock()
+        self._tx_depth = 0
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=67108864")  # 64 MB; the database holds a few thousand rows
         self._init_database()
     
     @contextmanager
     def _get_connection(self):
         """Get database connection context manager."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-        finally:
-            conn.close()
+        with self._lock:
+            yield self._conn
+    
+    def _commit(self, conn: sqlite3.Connection):
+        """Commit unless an enclosing transaction() block will commit."""
+        if self._tx_depth == 0:
+            conn.commit()
+    
+    @contextmanager
+    def transaction(self):
+        """Group several writes into one transaction (and one fsync).
+        
+        Commits when the outermost block exits and rolls back on error.
+        """
+        with self._lock:
+            self._tx_depth += 1
+            try:
+                yield self._conn
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._conn.rollback()
+                raise
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self._conn.commit()
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
     
     def _init_database(self):
         """Initialize database tables if they don't exist."""
@@ -94,7 +130,7 @@ class TXTDatabase:
                 CREATE INDEX IF NOT EXISTS idx_domain_txt_task_id ON domain_results(txt_task_id)
             """)
             
-            conn.commit()
+            self._commit(conn)
     
     def create_txt_task(self, task_data: Dict) -> str:
         """Create a new TXT verification task.
@@ -124,7 +160,7 @@ class TXTDatabase:
                 task_data['created_at'].isoformat(),
                 task_data['updated_at'].isoformat()
             ))
-            conn.commit()
+            self._commit(conn)
             return task_data['id']
     
     def get_txt_task(self, task_id: str) -> Optional[Dict]:
@@ -184,7 +220,7 @@ class TXTDatabase:
                 f"UPDATE txt_verification_tasks SET {set_clause} WHERE id = ?",
                 values
             )
-            conn.commit()
+            self._commit(conn)
     
     def mark_task_verified(self, task_id: str, dns_raw: str, verified_at: datetime):
         """Mark task as verified.
@@ -288,7 +324,7 @@ class TXTDatabase:
                     datetime.now(timezone.utc).isoformat()
                 ))
             
-            conn.commit()
+            self._commit(conn)
             return result_id
     
     def update_domain_ownership(self, domain: str, case_id: str, 
@@ -314,7 +350,70 @@ class TXTDatabase:
                 domain,
                 case_id
             ))
-            conn.commit()
+            self._commit(conn)
+    
+    def bulk_mark_verified(self, rows: Iterable[Tuple[str, str, datetime]]):
+        """Mark several tasks as verified in one statement.
+        
+        Args:
+            rows: (task_id, dns_raw, verified_at) tuples
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._get_connection() as conn:
+            conn.executemany("""
+                UPDATE txt_verification_tasks 
+                SET status = 'VERIFIED', dns_raw_result = ?, verified_at = ?,
+                    last_checked_at = ?, updated_at = ?
+                WHERE id = ?
+            """, [
+                (dns_raw, verified_at.isoformat(), verified_at.isoformat(), now, task_id)
+                for task_id, dns_raw, verified_at in rows
+            ])
+            self._commit(conn)
+    
+    def bulk_increment_attempts(self, rows: Iterable[Tuple[str, Optional[str], Optional[str], datetime]]):
+        """Increment attempt counters for several tasks in one statement.
+        
+        Same rules as increment_task_attempt(): empty DNS output or error
+        keep the stored values, and tasks reaching max_attempts are marked FAILED.
+        
+        Args:
+            rows: (task_id, dns_raw, error, checked_at) tuples
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._get_connection() as conn:
+            conn.executemany("""
+                UPDATE txt_verification_tasks 
+                SET attempts = attempts + 1,
+                    last_checked_at = ?,
+                    dns_raw_result = COALESCE(NULLIF(?, ''), dns_raw_result),
+                    fail_reason = COALESCE(NULLIF(?, ''), fail_reason),
+                    status = CASE WHEN attempts + 1 >= max_attempts THEN 'FAILED' ELSE status END,
+                    updated_at = ?
+                WHERE id = ?
+            """, [
+                (checked_at.isoformat(), dns_raw, error, now, task_id)
+                for task_id, dns_raw, error, checked_at in rows
+            ])
+            self._commit(conn)
+    
+    def bulk_update_domain_ownership(self, rows: Iterable[Tuple[str, str, str, str]]):
+        """Update ownership status for several domains in one statement.
+        
+        Args:
+            rows: (domain, case_id, ownership_status, ownership_reason) tuples
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._get_connection() as conn:
+            conn.executemany("""
+                UPDATE domain_results 
+                SET ownership_status = ?, ownership_reason = ?, updated_at = ?
+                WHERE domain = ? AND case_id = ?
+            """, [
+                (ownership_status, ownership_reason, now, domain, case_id)
+                for domain, case_id, ownership_status, ownership_reason in rows
+            ])
+            self._commit(conn)
     
     def get_tasks_by_case(self, case_id: str) -> List[Dict]:
         """Get all TXT tasks for a case.
@@ -334,6 +433,26 @@ class TXTDatabase:
             rows = cursor.fetchall()
             return [self._row_to_dict(row) for row in rows]
     
+    def get_task_summaries_by_case(self, case_id: str) -> List[Dict]:
+        """Get a case's TXT tasks in creation order, without the raw DNS output.
+        
+        Only the columns shown to users are selected.
+        
+        Args:
+            case_id: Case/run ID
+            
+        Returns:
+            List of task dictionaries
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT id, domain, txt_name, expected_token, status, attempts, max_attempts, "
+                "created_at, verified_at, fail_reason "
+                "FROM txt_verification_tasks WHERE case_id = ? ORDER BY created_at",
+                (case_id,)
+            ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+    
     def _row_to_dict(self, row: sqlite3.Row) -> Dict:
         """Convert SQLite row to dictionary.
         
@@ -1,9 +1,15 @@
 """Utility functions and classes."""
 from .csv_exporter import CSVExporter
-from .evidence_generator import EvidenceGenerator
 
 __all__ = [
     "CSVExporter",
     "EvidenceGenerator"
 ]
 
+
+def __getattr__(name):
+    # EvidenceGenerator pulls in Playwright, so only import it on first access
+    if name == "EvidenceGenerator":
+        from .evidence_generator import EvidenceGenerator
+        return EvidenceGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,7 @@ CSV export functionality for domain lookup results.
 """
 import csv
 from io import StringIO
-from typing import List
+from typing import Iterable, List
 from src.models.domain import DomainResult
 
 
@@ -46,43 +46,63 @@ class CSVExporter:
         return str(value)
     
     @staticmethod
-    def export_to_csv(results: List[DomainResult]) -> str:
-        """Export domain results to CSV format.
+    def to_row(result: DomainResult) -> List[str]:
+        """Format a result as a CSV row in FIELD_ORDER.
         
         Args:
-            results: List of DomainResult objects
+            result: DomainResult object
             
         Returns:
-            CSV string
+            Formatted cell values
         """
-        output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=CSVExporter.FIELD_ORDER)
+        return [CSVExporter.format_value(getattr(result, field, None)) for field in CSVExporter.FIELD_ORDER]
+    
+    @staticmethod
+    def _write_rows(f, rows: Iterable[List[str]]):
+        """Write the header and pre-formatted rows to a text stream.
         
-        # Write header
-        writer.writeheader()
+        Args:
+            f: Writable text stream
+            rows: Rows in FIELD_ORDER, consumed one at a time
+        """
+        writer = csv.writer(f)
+        writer.writerow(CSVExporter.FIELD_ORDER)
+        writer.writerows(rows)
+    
+    @staticmethod
+    def _write(f, results: Iterable[DomainResult]):
+        """Write the header and one row per result to a text stream.
         
-        # Write rows
-        for result in results:
-            row = {}
-            
-            for field in CSVExporter.FIELD_ORDER:
-                value = getattr(result, field, None)
-                row[field] = CSVExporter.format_value(value)
-            
-            writer.writerow(row)
+        Args:
+            f: Writable text stream
+            results: DomainResult objects, consumed one at a time
+        """
+        CSVExporter._write_rows(f, map(CSVExporter.to_row, results))
+    
+    @staticmethod
+    def export_to_csv(results: Iterable[DomainResult]) -> str:
+        """Export domain results to CSV format.
         
+        Args:
+            results: DomainResult objects
+            
+        Returns:
+            CSV string
+        """
+        output = StringIO()
+        CSVExporter._write(output, results)
         return output.getvalue()
     
     @staticmethod
-    def save_to_file(results: List[DomainResult], filepath: str):
+    def save_to_file(results: Iterable[DomainResult], filepath: str):
         """Save domain results to CSV file.
         
+        Rows are written as the iterable yields them, so a generator is
+        never materialized.
+        
         Args:
-            results: List of DomainResult objects
+            results: DomainResult objects
             filepath: Path to save CSV file
         """
-        csv_content = CSVExporter.export_to_csv(results)
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            f.write(csv_content)
-
+        with open(filepath, 'w', newline='', encoding='utf-8', buffering=1 << 16) as f:
+            CSVExporter._write(f, results)
@@ -0,0 +1,43 @@
+"""
+Tests for the page-text pre-cleaning applied before LLM parsing.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from complete_domain_pipeline import _clean_for_llm
+
+
+def test_whois_block_after_inline_disclaimer_link_survives():
+    text = (
+        "Home | Disclaimer | Contact\n"
+        "Domain Name: example.com\n"
+        "Registrar: Example Registrar, Inc.\n"
+        "\n"
+        "Registrant Organization: Example Corp"
+    )
+
+    cleaned = _clean_for_llm(text, 8000)
+
+    assert "Domain Name: example.com" in cleaned
+    assert "Registrar: Example Registrar, Inc." in cleaned
+    assert "Registrant Organization: Example Corp" in cleaned
+
+
+def test_legal_notice_paragraph_is_removed():
+    text = (
+        "Domain Name: example.com\n"
+        " \n"
+        "\n"
+        "TERMS OF USE: You are not authorized to access or query our WHOIS\n"
+        "database through the use of high-volume, automated processes.\n"
+        "\n"
+        "Registrar: Example Registrar, Inc."
+    )
+
+    cleaned = _clean_for_llm(text, 8000)
+
+    assert "TERMS OF USE" not in cleaned
+    assert "automated processes" not in cleaned
+    assert cleaned == "Domain Name: example.com\n\nRegistrar: Example Registrar, Inc."
@@ -0,0 +1,54 @@
+"""
+Tests for CSV export of domain results.
+"""
+import csv
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.domain import DomainResult
+from src.utils.csv_exporter import CSVExporter
+
+TIMESTAMP = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def _result(domain: str) -> DomainResult:
+    return DomainResult(
+        domain=domain,
+        registrar="Example Registrar, Inc.",
+        nameservers=["ns1.example.com", "ns2.example.com"],
+        timestamp=TIMESTAMP
+    )
+
+
+def test_save_to_file_streams_a_generator(tmp_path):
+    consumed = []
+
+    def results():
+        for domain in ("a.com", "b.com"):
+            consumed.append(domain)
+            yield _result(domain)
+
+    path = tmp_path / "results.csv"
+    CSVExporter.save_to_file(results(), str(path))
+
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+
+    assert consumed == ["a.com", "b.com"]
+    assert rows[0] == CSVExporter.FIELD_ORDER
+    assert [row[0] for row in rows[1:]] == ["a.com", "b.com"]
+    assert rows[1][CSVExporter.FIELD_ORDER.index("registrar")] == "Example Registrar, Inc."
+    assert rows[1][CSVExporter.FIELD_ORDER.index("nameservers")] == "ns1.example.com; ns2.example.com"
+    assert rows[1][CSVExporter.FIELD_ORDER.index("registry")] == ""
+
+
+def test_export_to_csv_matches_save_to_file(tmp_path):
+    results = [_result("a.com"), _result("b.com")]
+    path = tmp_path / "results.csv"
+
+    CSVExporter.save_to_file(results, str(path))
+
+    assert path.read_bytes().decode('utf-8') == CSVExporter.export_to_csv(results)
@@ -0,0 +1,52 @@
+"""
+Tests for LLM micro-batching of Stage 2 pages.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from complete_domain_pipeline import CompleteDomainPipeline
+from config.settings import settings
+
+
+class _UncachedClient:
+    async def get_cached(self, cache_key, **options):
+        return None
+
+
+def _pipeline(batches):
+    """Pipeline with only the batching state, recording each batch sent."""
+    pipeline = CompleteDomainPipeline.__new__(CompleteDomainPipeline)
+    pipeline.llm_client = _UncachedClient()
+    pipeline._llm_pending = []
+    pipeline._llm_flush_handle = None
+    pipeline._llm_batch_tasks = set()
+
+    async def parse_batch(batch):
+        batches.append([domain for domain, _, _, _ in batch])
+        return {domain.lower(): {'registrar': domain} for domain, _, _, _ in batch}
+
+    pipeline._parse_batch_with_llm = parse_batch
+    return pipeline
+
+
+def test_full_stage2_batch_is_sent_without_waiting_for_the_timer(monkeypatch):
+    monkeypatch.setattr(settings, 'playwright_concurrency', 4)
+    monkeypatch.setattr(settings, 'llm_batch_size', 5)
+    monkeypatch.setattr(settings, 'llm_batch_window', 60)
+    batches = []
+    pipeline = _pipeline(batches)
+    domains = [f"d{i}.com" for i in range(settings.playwright_concurrency)]
+
+    async def parse_all():
+        return await asyncio.wait_for(
+            asyncio.gather(*(pipeline.parse_with_llm("text", d, "https://who.is") for d in domains)),
+            timeout=1
+        )
+
+    results = asyncio.run(parse_all())
+
+    assert batches == [domains]
+    assert [r['registrar'] for r in results] == domains
@@ -0,0 +1,62 @@
+"""
+Tests for the Stage 4 TXT polling delay.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from complete_domain_pipeline import CompleteDomainPipeline
+from config.settings import settings
+
+TASKS = [{'domain': "a.com"}, {'domain': "b.com"}]
+
+
+class _Checker:
+    def __init__(self, fresh_in: float):
+        self.fresh_in = fresh_in
+
+    def seconds_until_fresh(self, domains):
+        list(domains)
+        return self.fresh_in
+
+
+def _delay(attempt: int, progress: bool = False, fresh_in: float = 0.0, poll_interval: float = 60) -> float:
+    pipeline = CompleteDomainPipeline.__new__(CompleteDomainPipeline)
+    pipeline.txt_checker = _Checker(fresh_in)
+    return pipeline._next_poll_delay(attempt, poll_interval, progress, TASKS)
+
+
+@pytest.fixture(autouse=True)
+def poll_bounds(monkeypatch):
+    monkeypatch.setattr(settings, 'txt_min_poll_interval', 10)
+    monkeypatch.setattr(settings, 'txt_max_poll_interval', 600)
+
+
+def test_backs_off_exponentially_without_progress():
+    assert [_delay(attempt) for attempt in (1, 2, 3, 4)] == [60, 120, 240, 480]
+
+
+def test_progress_resets_to_the_minimum_interval():
+    assert _delay(4, progress=True) == 10
+
+
+def test_waits_for_cached_answers_to_expire():
+    assert _delay(1, progress=True, fresh_in=45) == 45
+    assert _delay(1, fresh_in=90) == 90
+    assert _delay(2, fresh_in=90) == 120
+
+
+def test_never_polls_faster_than_the_minimum_interval():
+    assert _delay(1, poll_interval=2) == 10
+
+
+def test_backoff_and_cache_wait_are_capped():
+    assert _delay(10) == 600
+    assert _delay(1, fresh_in=3600) == 600
+
+
+def test_ceiling_is_at_least_the_base_interval():
+    assert _delay(3, poll_interval=900) == 900
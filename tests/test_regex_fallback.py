@@ -0,0 +1,53 @@
+"""
+Tests for the single-pass regex fallback used when LLM parsing is unavailable.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from complete_domain_pipeline import (
+    _SIDN_COMBINED,
+    _SIDN_FIELDS,
+    _WHOIS_COMBINED,
+    _WHOIS_FIELDS,
+    _first_matches,
+)
+
+
+def test_label_inside_another_fields_value_is_still_found():
+    fields = _first_matches(_WHOIS_COMBINED, "Registrar: Created 1/2/2003", _WHOIS_FIELDS)
+
+    assert fields['registrar'] == "Created 1/2/2003"
+    assert fields['created'] == "1/2/2003"
+
+
+def test_registrant_organization_line_fills_both_organization_groups():
+    text = (
+        "Created 3/4/2005\n"
+        "Registrant Organization: Example Corp\n"
+        "Registrar: Example Registrar, Inc."
+    )
+
+    fields = _first_matches(_WHOIS_COMBINED, text, _WHOIS_FIELDS)
+
+    assert fields == {
+        'created': "3/4/2005",
+        'registrant_org': "Example Corp",
+        'org': "Example Corp",
+        'registrar': "Example Registrar, Inc.",
+    }
+
+
+def test_first_occurrence_of_each_label_wins():
+    text = "Registrar: First\nRegistrar: Second"
+
+    assert _first_matches(_WHOIS_COMBINED, text, _WHOIS_FIELDS)['registrar'] == "First"
+
+
+def test_sidn_dutch_labels():
+    text = "Registrar: Example B.V.\nAangemaakt: 2001-02-03"
+
+    fields = _first_matches(_SIDN_COMBINED, text, _SIDN_FIELDS)
+
+    assert fields == {'registrar': "Example B.V.", 'aangemaakt': "2001-02-03"}
@@ -0,0 +1,89 @@
+"""
+Tests for the RDAP response cache and the LLM response cache.
+"""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core import rdap_cache
+from src.core.llm_cache import LLMResponseCache
+from src.core.rdap_cache import RDAPResponseCache
+
+
+def test_rdap_cache_round_trip_and_expiry(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rdap_cache.time, "time", lambda: now[0])
+    cache = RDAPResponseCache(str(tmp_path / "rdap.db"), ttl=100, negative_ttl=10)
+    try:
+        cache.set("example.com", "rdap", "https://rdap.example/domain/example.com", {"ldhName": "example.com"})
+        cache.set("missing.com", "failed", "", None)
+
+        assert cache.get("example.com") == (
+            "rdap", "https://rdap.example/domain/example.com", {"ldhName": "example.com"}
+        )
+        assert cache.get("missing.com") == ("failed", "", None)
+
+        now[0] += 11
+        assert cache.get("missing.com") is None
+        assert cache.get("example.com") is not None
+
+        now[0] += 90
+        assert cache.get("example.com") is None
+    finally:
+        cache.close()
+
+
+def test_rdap_cache_zero_negative_ttl_disables_failure_caching(tmp_path):
+    cache = RDAPResponseCache(str(tmp_path / "rdap.db"), negative_ttl=0)
+    try:
+        cache.set("missing.com", "failed", "", None)
+
+        assert cache.get("missing.com") is None
+    finally:
+        cache.close()
+
+
+def test_llm_cache_disk_tier_survives_a_new_instance(tmp_path):
+    first = LLMResponseCache(str(tmp_path))
+    key = first.make_key("deepseek-chat", "page text", {})
+    asyncio.run(first.set(key, {"choices": []}))
+
+    second = LLMResponseCache(str(tmp_path))
+
+    assert asyncio.run(second.get(key)) == {"choices": []}
+
+
+def test_llm_cache_key_depends_on_version(tmp_path):
+    parts = ("deepseek-chat", "page text", {"temperature": 0})
+
+    assert (LLMResponseCache(str(tmp_path), version="1").make_key(*parts)
+            != LLMResponseCache(str(tmp_path), version="2").make_key(*parts))
+
+
+def test_llm_cache_expired_disk_entries_are_ignored_and_pruned(tmp_path):
+    cache = LLMResponseCache(str(tmp_path), disk_ttl=60)
+    stale, fresh = cache.make_key("stale"), cache.make_key("fresh")
+    asyncio.run(cache.set(stale, {"v": 1}))
+    asyncio.run(cache.set(fresh, {"v": 2}))
+    old = time.time() - 120
+    os.utime(tmp_path / f"{stale}.json", (old, old))
+
+    reopened = LLMResponseCache(str(tmp_path), disk_ttl=60)
+
+    assert not (tmp_path / f"{stale}.json").exists()
+    assert asyncio.run(reopened.get(stale)) is None
+    assert asyncio.run(reopened.get(fresh)) == {"v": 2}
+
+
+def test_llm_cache_memory_tier_evicts_least_recently_used(tmp_path):
+    cache = LLMResponseCache(str(tmp_path), maxsize=2)
+    cache._remember("a", {"v": "a"})
+    cache._remember("b", {"v": "b"})
+    cache._memory.move_to_end("a")
+    cache._remember("c", {"v": "c"})
+
+    assert list(cache._memory) == ["a", "c"]
@@ -0,0 +1,150 @@
+"""
+Tests for TXTRecordChecker's answer caching, single-flight lookups and dig parsing.
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import dns.message
+import dns.name
+import dns.resolver
+import dns.rrset
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core import txt_checker
+from src.core.txt_checker import TXTRecordChecker, _DIG_TXT_STRING
+
+SERVERS = ("1.1.1.1",)
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(txt_checker.time, "monotonic", fake)
+    return fake
+
+
+def _negative_response(soa_ttl: int, soa_minimum: int) -> dns.message.Message:
+    response = dns.message.make_response(dns.message.make_query("example.com", "TXT"))
+    response.authority.append(dns.rrset.from_text(
+        "example.com.", soa_ttl, "IN", "SOA",
+        f"ns1.example.com. admin.example.com. 1 7200 3600 1209600 {soa_minimum}"
+    ))
+    return response
+
+
+def test_negative_ttl_uses_smaller_of_soa_ttl_and_minimum():
+    error = dns.resolver.NoAnswer(response=_negative_response(soa_ttl=300, soa_minimum=60))
+
+    assert TXTRecordChecker._negative_ttl(error) == 60
+
+
+def test_negative_ttl_from_nxdomain_responses():
+    name = dns.name.from_text("example.com")
+    error = dns.resolver.NXDOMAIN(qnames=[name], responses={name: _negative_response(30, 900)})
+
+    assert TXTRecordChecker._negative_ttl(error) == 30
+
+
+def test_negative_ttl_without_soa_is_none():
+    response = dns.message.make_response(dns.message.make_query("example.com", "TXT"))
+
+    assert TXTRecordChecker._negative_ttl(dns.resolver.NoAnswer(response=response)) is None
+
+
+def test_remember_caps_ttl_and_skips_uncacheable_answers(clock):
+    checker = TXTRecordChecker(max_cache_ttl=300)
+    records = [('"token"', "token")]
+
+    checker._remember((SERVERS, "capped.com"), records, 3600)
+    checker._remember((SERVERS, "short.com"), records, 10)
+    checker._remember((SERVERS, "zero.com"), records, 0)
+    checker._remember((SERVERS, "unknown.com"), None, None)
+
+    assert checker._cache[(SERVERS, "capped.com")] == (clock.now + 300, records)
+    assert checker._cache[(SERVERS, "short.com")][0] == clock.now + 10
+    assert (SERVERS, "zero.com") not in checker._cache
+    assert (SERVERS, "unknown.com") not in checker._cache
+
+
+def test_cached_answers_are_served_until_they_expire(clock):
+    checker = TXTRecordChecker(nameservers=SERVERS, max_cache_ttl=300)
+    checker._remember((SERVERS, "example.com"), [('"token"', "token")], 10)
+    checker._remember((SERVERS, "missing.com"), None, 10)
+
+    assert asyncio.run(checker.check("example.com", "token")) == (True, '"token"', None)
+    assert asyncio.run(checker.check("missing.com", "token")) == (False, "", "NO_ANSWER")
+    assert checker.seconds_until_fresh(["example.com", "missing.com"]) == 10
+
+    clock.now += 11
+
+    assert checker.seconds_until_fresh(["example.com"]) == 0.0
+
+
+def test_concurrent_lookups_share_one_query():
+    checker = TXTRecordChecker(nameservers=SERVERS)
+    calls = []
+
+    async def resolve(key):
+        calls.append(key)
+        await asyncio.sleep(0)
+        return [('"token"', "token")], None
+
+    checker._resolve = resolve
+
+    async def lookup_three():
+        return await asyncio.gather(*(checker._lookup(SERVERS, "example.com") for _ in range(3)))
+
+    results = asyncio.run(lookup_three())
+
+    assert calls == [(SERVERS, "example.com")]
+    assert all(result == ([('"token"', "token")], None) for result in results)
+    assert checker._inflight == {}
+
+
+def test_dig_string_regex_joins_split_record():
+    line = b'"momen-verify-" "1a2b3c" "4d5e6f7g8h"'
+
+    assert b"".join(_DIG_TXT_STRING.findall(line)) == b"momen-verify-1a2b3c4d5e6f7g8h"
+
+
+def test_dig_string_regex_keeps_escaped_quotes_inside_a_string():
+    line = b'"say \\"hi\\"" "there"'
+
+    assert _DIG_TXT_STRING.findall(line) == [b'say \\"hi\\"', b"there"]
+
+
+class _FakeProcess:
+    def __init__(self, stdout: bytes):
+        self.stdout = stdout
+
+    async def communicate(self):
+        return self.stdout, b""
+
+
+@pytest.mark.parametrize("stdout, expected", [
+    (b'"v=spf1 -all"\n"momen-verify-" "abc123"\n', (True, None)),
+    (b'"momen-verify-abc123"\n', (True, None)),
+    (b'"v=spf1 -all"\n', (False, "TOKEN_NOT_FOUND")),
+    (b"", (False, "NO_ANSWER")),
+])
+def test_check_via_dig_handles_split_and_missing_tokens(monkeypatch, stdout, expected):
+    async def fake_exec(*args, **kwargs):
+        return _FakeProcess(stdout)
+
+    monkeypatch.setattr(txt_checker.asyncio, "create_subprocess_exec", fake_exec)
+    checker = TXTRecordChecker(nameservers=SERVERS)
+
+    success, _, error = asyncio.run(checker._check_via_dig("example.com", "momen-verify-abc123", "1.1.1.1"))
+
+    assert (success, error) == expected
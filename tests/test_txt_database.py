@@ -0,0 +1,145 @@
+"""
+Tests for the TXT verification database: bulk updates and transactions.
+"""
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.txt_database import TXTDatabase
+
+
+def _create_task(db: TXTDatabase, task_id: str, max_attempts: int = 3, case_id: str = "case-1"):
+    now = datetime.now(timezone.utc)
+    db.create_txt_task({
+        'id': task_id,
+        'case_id': case_id,
+        'domain': f"{task_id}.com",
+        'txt_name': "@",
+        'expected_token': f"momen-verify-{task_id}",
+        'status': 'WAITING',
+        'attempts': 0,
+        'max_attempts': max_attempts,
+        'created_at': now,
+        'updated_at': now
+    })
+
+
+def _committed_task_ids(db_path: Path):
+    """Task IDs visible to a separate connection, i.e. committed ones."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return {row[0] for row in conn.execute("SELECT id FROM txt_verification_tasks")}
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def db():
+    database = TXTDatabase(":memory:")
+    yield database
+    database.close()
+
+
+def test_bulk_increment_attempts_fails_tasks_at_max_attempts(db):
+    _create_task(db, "a", max_attempts=2)
+    _create_task(db, "b", max_attempts=1)
+    checked_at = datetime.now(timezone.utc)
+
+    db.bulk_increment_attempts([
+        ("a", '"other-token"', "TOKEN_NOT_FOUND", checked_at),
+        ("b", '"other-token"', "TOKEN_NOT_FOUND", checked_at),
+    ])
+
+    a, b = db.get_txt_task("a"), db.get_txt_task("b")
+    assert (a['attempts'], a['status']) == (1, 'WAITING')
+    assert (b['attempts'], b['status']) == (1, 'FAILED')
+    assert b['fail_reason'] == "TOKEN_NOT_FOUND"
+    assert b['last_checked_at'] == checked_at.isoformat()
+
+    db.bulk_increment_attempts([("a", None, "TIMEOUT", checked_at)])
+
+    a = db.get_txt_task("a")
+    assert (a['attempts'], a['status']) == (2, 'FAILED')
+
+
+def test_bulk_increment_attempts_keeps_stored_values_on_empty_output(db):
+    _create_task(db, "a", max_attempts=5)
+    checked_at = datetime.now(timezone.utc)
+
+    db.bulk_increment_attempts([("a", '"first"', "TOKEN_NOT_FOUND", checked_at)])
+    db.bulk_increment_attempts([("a", "", None, checked_at)])
+
+    a = db.get_txt_task("a")
+    assert a['attempts'] == 2
+    assert a['dns_raw_result'] == '"first"'
+    assert a['fail_reason'] == "TOKEN_NOT_FOUND"
+
+
+def test_bulk_mark_verified_only_touches_listed_tasks(db):
+    _create_task(db, "a")
+    _create_task(db, "b")
+    verified_at = datetime.now(timezone.utc)
+
+    db.bulk_mark_verified([("a", '"momen-verify-a"', verified_at)])
+
+    a, b = db.get_txt_task("a"), db.get_txt_task("b")
+    assert a['status'] == 'VERIFIED'
+    assert a['dns_raw_result'] == '"momen-verify-a"'
+    assert a['verified_at'] == verified_at.isoformat()
+    assert b['status'] == 'WAITING'
+
+
+def test_bulk_update_domain_ownership_matches_domain_and_case(db):
+    for case_id in ("case-1", "case-2"):
+        db.save_domain_result({
+            'case_id': case_id,
+            'domain': "a.com",
+            'ownership_status': "PENDING_TXT",
+            'ownership_reason': "TXT verification requested."
+        })
+
+    db.bulk_update_domain_ownership([("a.com", "case-1", "VERIFIED_BY_TXT", "verified")])
+
+    rows = dict(db._conn.execute("SELECT case_id, ownership_status FROM domain_results").fetchall())
+    assert rows == {"case-1": "VERIFIED_BY_TXT", "case-2": "PENDING_TXT"}
+
+
+def test_nested_transaction_commits_when_outermost_block_exits(tmp_path):
+    db_path = tmp_path / "txt.db"
+    db = TXTDatabase(str(db_path))
+    try:
+        with db.transaction():
+            with db.transaction():
+                _create_task(db, "a")
+            # The inner block does not commit on its own
+            assert _committed_task_ids(db_path) == set()
+            _create_task(db, "b")
+
+        assert _committed_task_ids(db_path) == {"a", "b"}
+    finally:
+        db.close()
+
+
+def test_nested_transaction_rolls_back_every_write_on_error(tmp_path):
+    db_path = tmp_path / "txt.db"
+    db = TXTDatabase(str(db_path))
+    try:
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                _create_task(db, "a")
+                with db.transaction():
+                    _create_task(db, "b")
+                    raise RuntimeError("boom")
+
+        assert _committed_task_ids(db_path) == set()
+
+        # Depth is back to zero, so plain writes commit immediately again
+        _create_task(db, "c")
+        assert _committed_task_ids(db_path) == {"c"}
+    finally:
+        db.close()